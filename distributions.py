@@ -1,5 +1,5 @@
+import math
 import numpy as np
-from scipy.stats import skewnorm
 from abc import ABC, abstractmethod
 
 """
@@ -9,8 +9,24 @@ Network with him at: https://www.linkedin.com/in/samuellehmann/
 
 # The maximum number of iterations to be run for cutoff distributions
 _MAX_ITERATIONS = 100
+# Extra samples drawn in each cutoff batch, on top of those expected to be needed from the acceptance rate
+_BATCH_SAFETY_FACTOR = 1.2
+# Below this expected acceptance rate, normal distributions with cutoffs are sampled through the inverse CDF rather
+# than by rejection
+_INVERSE_CDF_ACCEPTANCE = 0.1
+# The lowest acceptance rate assumed when sizing cutoff batches
+_MIN_ACCEPTANCE_RATE = 1e-3
+# The largest cutoff batch, as a multiple of the number of samples
+_MAX_BATCH_MULTIPLE = 20
 # The default number of samples if no other value is specified
 DEFAULT_SAMPLES = 50000
+# The default type of the samples, single precision is ample for tolerance analysis and halves memory use
+DEFAULT_DTYPE = np.float32
+# The version of the pickled state of distributions, increased when the meaning of a saved attribute changes
+_STATE_VERSION = 1
+# The random generator shared by all distributions that aren't given their own. Reproducible samples require a seeded
+# generator to be passed to the distributions.
+_GLOBAL_RNG = np.random.default_rng()
 
 
 class Distribution(ABC):
@@ -18,7 +34,12 @@ class Distribution(ABC):
     An abstract class that parents all distributions
     """
 
-    def __init__(self, name: str, num_samples: int = DEFAULT_SAMPLES, mid_length=None, lower_lim=None, upper_lim=None):
+    # Attributes are stored in slots rather than a per-instance dictionary, as stacks may hold many distributions
+    __slots__ = ("num_samples", "dtype", "lower_lim", "upper_lim", "name", "nominal_value", "mean", "std", "skew",
+                 "_lo", "_hi", "_rng", "_mask", "_mask_scratch")
+
+    def __init__(self, name: str, num_samples: int = DEFAULT_SAMPLES, mid_length=None, lower_lim=None, upper_lim=None,
+                 dtype=DEFAULT_DTYPE, rng=None):
         """
         An abstract class that parents all distributions
         :param num_samples: The number of samples. Defaults to DEFAULT SAMPLES
@@ -26,15 +47,64 @@ class Distribution(ABC):
         :param lower_lim: A cutoff at a lower limit, no cutoff applied if no value passed
         :param upper_lim: A cutoff at an upper limit, no cutoff applied if no value passed
         :param name: A string representation of the distribution
+        :param dtype: The numpy type of the samples. Defaults to DEFAULT_DTYPE
+        :param rng: The numpy random generator to sample from. Defaults to a generator shared by all distributions
         """
         self.num_samples = num_samples
-        self.lower_lim = lower_lim
-        self.upper_lim = upper_lim
+        self.dtype = np.dtype(dtype)
         self.name = name
         self.nominal_value = mid_length
         self.mean = None
         self.std = None
         self.skew = None
+        self.set_limits(lower_lim, upper_lim)
+        self._rng = rng if rng is not None else _GLOBAL_RNG
+        self._mask = None
+        self._mask_scratch = None
+
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in _slot_names(type(self)) if hasattr(self, name)}
+        # The random generator isn't saved, so loaded stacks don't replay their samples.
+        # The buffers and the cutoffs in the type of the samples are also recreated rather than saved.
+        for name in ("_rng", "_mask", "_mask_scratch", "_lo", "_hi"):
+            del state[name]
+        state["_state_version"] = _STATE_VERSION
+        return state
+
+    def __setstate__(self, state):
+        # Distributions saved before slots were used store their state as the contents of their dictionary, which
+        # is restored in the same way
+        state = dict(state)
+        state_version = state.pop("_state_version", 0)
+        # Distributions saved before the sample type was configurable don't store it
+        self.dtype = np.dtype(DEFAULT_DTYPE)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._rng = _GLOBAL_RNG
+        self._mask = None
+        self._mask_scratch = None
+
+        if state_version < 1:
+            # Cutoffs of 0.0 used to mean that no cutoff was applied
+            if not self.lower_lim:
+                self.lower_lim = None
+            if not self.upper_lim:
+                self.upper_lim = None
+
+        self.set_limits(self.lower_lim, self.upper_lim)
+
+    def set_limits(self, lower_lim, upper_lim):
+        """
+        Sets the cutoffs of the distribution. Copies of the cutoffs are kept in the type of the samples, so that they
+        don't need to be converted each time they are compared against the samples.
+        :param lower_lim: A cutoff at a lower limit, no cutoff applied if None
+        :param upper_lim: A cutoff at an upper limit, no cutoff applied if None
+        :return: None
+        """
+        self.lower_lim = lower_lim
+        self.upper_lim = upper_lim
+        self._lo = None if lower_lim is None else self.dtype.type(lower_lim)
+        self._hi = None if upper_lim is None else self.dtype.type(upper_lim)
 
     def mid_length(self):
         """
@@ -42,6 +112,12 @@ class Distribution(ABC):
         """
         return self.nominal_value
 
+    def rng(self):
+        """
+        :return: The numpy random generator that the distribution samples from
+        """
+        return self._rng
+
     @abstractmethod
     def calculate(self):
         """
@@ -50,6 +126,50 @@ class Distribution(ABC):
         """
         pass
 
+    def _cutoff_masks(self, size):
+        """
+        Returns boolean buffers to build cutoff masks in. The buffers are kept between calls and only reallocated when
+        they are too small, so masks can be built without allocating temporary arrays.
+        :param size: The number of values to be masked
+        :return: A tuple of two boolean numpy arrays of the given size, the mask and a scratch array
+        """
+        if self._mask is None or self._mask.size < size:
+            self._mask = np.empty(size, dtype=bool)
+            self._mask_scratch = np.empty(size, dtype=bool)
+        return self._mask[:size], self._mask_scratch[:size]
+
+    def _sample_with_cutoffs(self, acceptance=1.0):
+        """
+        Returns a random sampling from the distribution with its cutoffs applied, drawing batches of samples through
+        the _draw method of the distribution and rejecting those outside of the cutoffs
+        :param acceptance: The expected fraction of samples within the cutoffs, used to size the first batch
+        :return: A randomly ordered numpy array of values
+        """
+        # Select the filter for the cutoffs once, rather than checking which cutoffs are present for every batch
+        apply_cutoffs = _CUTOFF_FILTERS[(self._lo is not None) + 2 * (self._hi is not None)]
+
+        # Copy the in range samples of each batch into the values, stopping as soon as they are filled. The samples
+        # of a batch are independent, so keeping the first of them doesn't bias the values.
+        values = np.empty(self.num_samples, dtype=self.dtype)
+        num_values = 0
+        for count in range(_MAX_ITERATIONS):
+            # Size each batch from the acceptance rate so that it is likely to be the last
+            batch_size = min(math.ceil((self.num_samples - num_values) / acceptance * _BATCH_SAFETY_FACTOR),
+                             _MAX_BATCH_MULTIPLE * self.num_samples)
+            batch = apply_cutoffs(self._draw(batch_size), self._lo, self._hi, *self._cutoff_masks(batch_size))
+
+            num_kept = min(len(batch), self.num_samples - num_values)
+            values[num_values:num_values + num_kept] = batch[:num_kept]
+            num_values += num_kept
+
+            if num_values == self.num_samples:
+                return values
+
+            batch_acceptance = max(len(batch) / batch_size, _MIN_ACCEPTANCE_RATE)
+            acceptance = batch_acceptance if count == 0 else 0.5 * acceptance + 0.5 * batch_acceptance
+
+        raise ValueError('Number of iterations exceeds the maximum set for cutoff distributions.')
+
     def abs_max(self):
         """
         The absolute maximum value possible in the distrbibution. May be none if not defined.
@@ -72,7 +192,10 @@ class Normal(Distribution):
     A class for a normal distribution
     """
 
-    def __init__(self, mean: float, std: float, num_samples: int = DEFAULT_SAMPLES, lower_lim=None, upper_lim=None):
+    __slots__ = ("_lower_cdf", "_upper_cdf", "_use_inverse_cdf")
+
+    def __init__(self, mean: float, std: float, num_samples: int = DEFAULT_SAMPLES, lower_lim=None, upper_lim=None,
+                 dtype=DEFAULT_DTYPE, rng=None):
         """
 
         :param mean: The mean value for the distribution
@@ -80,39 +203,70 @@ class Normal(Distribution):
         :param num_samples: Optional - the number of samples within the common lengths
         :param lower_lim: A cutoff at a lower limit, no cutoff applied if no value passed
         :param upper_lim: A cutoff at an upper limit, no cutoff applied if no value passed
+        :param dtype: The numpy type of the samples. Defaults to DEFAULT_DTYPE
+        :param rng: Optional - the numpy random generator to sample from. Defaults to a generator shared by all
+        distributions
         """
-        super().__init__("Normal", num_samples, mean, lower_lim, upper_lim)
+        super().__init__("Normal", num_samples, mean, lower_lim, upper_lim, dtype, rng)
         self.mean = mean
         self.std = std
-        self.lower_lim = lower_lim
-        self.upper_lim = upper_lim
+        self._set_sampler()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        for name in ("_lower_cdf", "_upper_cdf", "_use_inverse_cdf"):
+            del state[name]
+        return state
+
+    def set_limits(self, lower_lim, upper_lim):
+        super().set_limits(lower_lim, upper_lim)
+        # The mean and standard deviation are not yet set when the parent class sets the initial cutoffs
+        if self.std is not None:
+            self._set_sampler()
+
+    def _set_sampler(self):
+        """
+        Chooses how the distribution is sampled with its cutoffs from the probability of a sample falling within them.
+        Rejection sampling is cheapest when most samples are kept, otherwise the inverse CDF is used so that the number
+        of samples drawn doesn't grow as the cutoffs tighten.
+        :return: None
+        """
+        self._lower_cdf = _standard_normal_cdf((self.lower_lim - self.mean) / self.std) \
+            if self.lower_lim is not None else 0.0
+        self._upper_cdf = _standard_normal_cdf((self.upper_lim - self.mean) / self.std) \
+            if self.upper_lim is not None else 1.0
+        self._use_inverse_cdf = self._upper_cdf - self._lower_cdf < _INVERSE_CDF_ACCEPTANCE
 
     def calculate(self):
         """
         Returns a random sampling from the distribution in the form of a numpy array.
         :return: A randomly ordered numpy array of values
         """
-        values = np.random.normal(self.mean, self.std, self.num_samples)
-        if self.lower_lim or self.upper_lim:
-            # remove samples not in range
-            if self.lower_lim:
-                values = values[values >= self.lower_lim]
-            if self.upper_lim:
-                values = values[values <= self.upper_lim]
-
-            count = 0
-            while len(values) < self.num_samples:
-                values = np.append(values, np.random.normal(self.mean, self.std, self.num_samples))
-                if self.lower_lim:
-                    values = values[values >= self.lower_lim]
-                if self.upper_lim:
-                    values = values[values <= self.upper_lim]
-                count += 1
-                if count > _MAX_ITERATIONS:
-                    raise ValueError('Number of iterations exceeds the maximum set for cutoff distributions.')
-
-            values = values[:self.num_samples]
+        if self._lo is None and self._hi is None:
+            return self._draw(self.num_samples)
+
+        if not self._use_inverse_cdf:
+            return self._sample_with_cutoffs(self._upper_cdf - self._lower_cdf)
+
+        # Sample the truncated distribution directly through the inverse CDF, so no samples are rejected
+        if self._lower_cdf >= self._upper_cdf:
+            raise ValueError('The cutoffs do not leave any values within the distribution.')
+
+        # scipy is only imported when it is needed, as it is slow to import
+        from scipy.special import ndtri
 
+        values = self.mean + self.std * ndtri(self._rng.uniform(self._lower_cdf, self._upper_cdf, self.num_samples))
+        return values.astype(self.dtype, copy=False)
+
+    def _draw(self, num_samples):
+        """
+        Draws samples from the normal distribution without any cutoffs
+        :param num_samples: The number of samples to draw
+        :return: A randomly ordered numpy array of values
+        """
+        values = self._rng.standard_normal(num_samples, dtype=self.dtype)
+        values *= self.std
+        values += self.mean
         return values
 
 
@@ -121,23 +275,51 @@ class Uniform(Distribution):
     A class for a uniform distribution
     """
 
-    def __init__(self, nominal: float, tolerance: float, num_samples: int = DEFAULT_SAMPLES):
+    __slots__ = ("nominal", "tolerance", "_low", "_width")
+
+    def __init__(self, nominal: float, tolerance: float, num_samples: int = DEFAULT_SAMPLES, dtype=DEFAULT_DTYPE,
+                 rng=None):
         """
 
         :param nominal: The nominal value
         :param tolerance: The bi-directional tolerance of common lengths
         :param num_samples: The number of samples within the common lengths
+        :param dtype: The numpy type of the samples. Defaults to DEFAULT_DTYPE
+        :param rng: Optional - the numpy random generator to sample from. Defaults to a generator shared by all
+        distributions
         """
-        super().__init__("Uniform", num_samples, nominal, nominal - tolerance, nominal + tolerance)
+        super().__init__("Uniform", num_samples, nominal, nominal - tolerance, nominal + tolerance, dtype, rng)
         self.nominal = nominal
         self.tolerance = tolerance
+        self._set_sampling_bounds()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # The bounds of a uniform distribution aren't optional cutoffs, so bounds of 0.0 that were cleared as unused
+        # cutoffs of an older save are restored from the nominal value and tolerance
+        lower_lim = self.nominal - self.tolerance if self.lower_lim is None else self.lower_lim
+        upper_lim = self.nominal + self.tolerance if self.upper_lim is None else self.upper_lim
+        self.set_limits(lower_lim, upper_lim)
+        self._set_sampling_bounds()
+
+    def _set_sampling_bounds(self):
+        """
+        Caches the bounds that samples are scaled to
+        :return: None
+        """
+        self._low = self.nominal - self.tolerance
+        self._width = 2 * self.tolerance
 
     def calculate(self):
         """
         Returns a random sampling from the distribution in the form of a numpy array.
         :return: A randomly ordered numpy array of values
         """
-        return np.random.uniform(self.nominal - self.tolerance, self.nominal + self.tolerance, self.num_samples)
+        # The samples are scaled in place, rather than allocating a new array for each operation
+        values = self._rng.random(self.num_samples, dtype=self.dtype)
+        values *= self._width
+        values += self._low
+        return values
 
 
 class SkewedNormal(Distribution):
@@ -145,8 +327,10 @@ class SkewedNormal(Distribution):
     A class for a skewed normal distribution
     """
 
+    __slots__ = ("_delta", "_delta_complement")
+
     def __init__(self, skew: float, mean: float, std: float, num_samples: int = DEFAULT_SAMPLES, lower_lim=None,
-                 upper_lim=None):
+                 upper_lim=None, dtype=DEFAULT_DTYPE, rng=None):
         """
 
         :param skew: 0 gives the normal distribution. A negative value will create a left skew whilst a positive
@@ -156,39 +340,114 @@ class SkewedNormal(Distribution):
         :param num_samples: The number of samples within the common lengths
         :param lower_lim: A cutoff at a lower limit, no cutoff applied if no value passed
         :param upper_lim: A cutoff at an upper limit, no cutoff applied if no value passed
+        :param dtype: The numpy type of the samples. Defaults to DEFAULT_DTYPE
+        :param rng: Optional - the numpy random generator to sample from. Defaults to a generator shared by all
+        distributions
         """
-        super().__init__("Skewed Normal", num_samples, mean, lower_lim, upper_lim)
+        super().__init__("Skewed Normal", num_samples, mean, lower_lim, upper_lim, dtype, rng)
         self.skew = skew
         self.mean = mean
         self.std = std
-        self.lower_lim = lower_lim
-        self.upper_lim = upper_lim
+        self._set_shape()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._set_shape()
+
+    def _set_shape(self):
+        """
+        Caches the coefficients of Azzalini's construction, which only depend on the skew, so they aren't recalculated
+        for every batch of samples
+        :return: None
+        """
+        self._delta = self.skew / math.sqrt(1 + self.skew ** 2)
+        self._delta_complement = math.sqrt(1 - self._delta ** 2)
 
     def calculate(self):
         """
         Returns a random sampling from the distribution in the form of a numpy array.
         :return: A randomly ordered numpy array of values
         """
-        values = skewnorm.rvs(self.skew, self.mean, self.std, self.num_samples).astype(np.float64)
-        if self.lower_lim or self.upper_lim:
-            # remove samples not in range
-            if self.lower_lim:
-                values = values[values >= self.lower_lim]
-            if self.upper_lim:
-                values = values[values <= self.upper_lim]
-
-            count = 0
-            while len(values) < self.num_samples:
-                values = np.append(values,
-                                   skewnorm.rvs(self.skew, self.mean, self.std, self.num_samples).astype(np.float64))
-                if self.lower_lim:
-                    values = values[values >= self.lower_lim]
-                if self.upper_lim:
-                    values = values[values <= self.upper_lim]
-                count += 1
-                if count > _MAX_ITERATIONS:
-                    raise ValueError('Number of iterations exceeds the maximum set for cutoff distributions.')
-
-            values = values[:self.num_samples]
+        if self._lo is None and self._hi is None:
+            return self._draw(self.num_samples)
+
+        return self._sample_with_cutoffs()
+
+    def _draw(self, num_samples):
+        """
+        Draws samples from the skewed normal distribution without any cutoffs, combining two standard normal samples
+        using Azzalini's construction: delta * |u| + sqrt(1 - delta ** 2) * v
+        :param num_samples: The number of samples to draw
+        :return: A randomly ordered numpy array of values
+        """
+        values = self._rng.standard_normal(num_samples, dtype=self.dtype)
+        v = self._rng.standard_normal(num_samples, dtype=self.dtype)
 
+        # Combine the samples in place, so that no temporary arrays are created and the sample type is kept
+        np.abs(values, out=values)
+        values *= self._delta
+        v *= self._delta_complement
+        values += v
+        values *= self.std
+        values += self.mean
         return values
+
+
+def _no_cutoffs(values, lower_lim, upper_lim, mask, scratch):
+    """
+    A cutoff filter for distributions without cutoffs
+    :return: The values, unchanged
+    """
+    return values
+
+
+def _lower_cutoff(values, lower_lim, upper_lim, mask, scratch):
+    """
+    A cutoff filter for distributions with only a lower cutoff
+    :return: A numpy array of the values at or above the lower cutoff
+    """
+    np.greater_equal(values, lower_lim, out=mask)
+    return values.compress(mask)
+
+
+def _upper_cutoff(values, lower_lim, upper_lim, mask, scratch):
+    """
+    A cutoff filter for distributions with only an upper cutoff
+    :return: A numpy array of the values at or below the upper cutoff
+    """
+    np.less_equal(values, upper_lim, out=mask)
+    return values.compress(mask)
+
+
+def _both_cutoffs(values, lower_lim, upper_lim, mask, scratch):
+    """
+    A cutoff filter for distributions with both cutoffs, combining both comparisons into a single mask
+    :return: A numpy array of the values within the cutoffs
+    """
+    np.greater_equal(values, lower_lim, out=mask)
+    np.less_equal(values, upper_lim, out=scratch)
+    np.logical_and(mask, scratch, out=mask)
+    return values.compress(mask)
+
+
+def _standard_normal_cdf(x):
+    """
+    The cumulative distribution function of the standard normal distribution, for a single value
+    :param x: The value
+    :return: The probability of a sample being at or below the value
+    """
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _slot_names(cls):
+    """
+    Returns the names of the slots of a class, including those declared by its parents
+    :param cls: The class
+    :return: A list of slot names
+    """
+    return [name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())]
+
+
+# Filters that remove values outside of the cutoffs, indexed by has_lower_lim + 2 * has_upper_lim. Each takes the
+# values, the lower cutoff, the upper cutoff and two boolean buffers of the same size as the values to build masks in.
+_CUTOFF_FILTERS = (_no_cutoffs, _lower_cutoff, _upper_cutoff, _both_cutoffs)
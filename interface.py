@@ -1,5 +1,6 @@
 import pickle
 import sys
+from dataclasses import dataclass
 import tkinter as tk
 from tkinter import ttk, filedialog
 from tkinter.ttk import Frame, Button, Label, Entry, Combobox
@@ -7,6 +8,7 @@ from io import BytesIO
 import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from PIL import Image
 import distributions
 from stack_manager import StackManager, get_cpk, lengths_to_magnitudes
 from stackup_step import StackupStep
@@ -21,17 +23,82 @@ Network with him at: https://www.linkedin.com/in/samuellehmann/
 TITLE = "Tol Ninja: Tolerance Stackup Analysis"
 _DECIMAL_PLACES = 2
 _MPL_BACKGROUND = "#1c1c1c"
+# Protocol 5 pickles the sample arrays of a stack straight from their memory, rather than copying them into bytes first
+_PICKLE_PROTOCOL = 5
+# The buffer size used when saving and loading stacks, large enough that their sample arrays take few system calls
+_FILE_BUFFER_SIZE = 1 << 20
+# The time in milliseconds that typing in a custom limit must pause for before the report is updated
+_CUSTOM_LIMIT_DELAY = 150
+# The relative widths of the overall and magnitude histograms of radial stacks, which share the overall figure
+_RADIAL_WIDTH_RATIOS = (6, 7)
+# The margin in inches left around axes when they are cropped from their figures into report images
+_IMAGE_PAD_INCHES = 0.1
 
 row_entries = []
+# The histograms and summaries of each stackup step in the report frame, reused between refreshes
+step_reports = []
 
-# UI Elements
-table_frame, bold_style, tab_control, root, arrow_figure, oal_figure, stack_manager, middle_frame, report_scroll_canvas, \
-setup_scroll_canvas, setup_scroll_canvas_frame, oal_lsl_lref, oal_usl_limit_lref, magnitude_figure, mean_label, \
-median_label, min_label, max_label, samples_label, absolute_label, percent_below_label, \
-percent_above_label, percent_ok_label, percent_nok_label, custom_lower_entry_sv, custom_upper_entry_sv, \
-percent_below_custom_label, percent_above_custom_label, percent_good_custom_label, \
-percent_bad_custom_label, std_label, cpk_label, cust_cpk_label, stack_type_combo, title_entry, author_entry, \
-revision_entry = (None for i in range(37))
+
+@dataclass
+class UIState:
+    """
+    The widgets of the interface, and the state shared between its functions
+    """
+    # Main window
+    root: tk.Tk = None
+    tab_control: ttk.Notebook = None
+    bold_style: ttk.Style = None
+
+    # Setup tab
+    table_frame: Frame = None
+    setup_scroll_canvas: tk.Canvas = None
+    setup_scroll_canvas_frame: int = None
+    oal_lsl_lref: "LabelRestrictedEntryFrame" = None
+    oal_usl_limit_lref: "LabelRestrictedEntryFrame" = None
+    stack_type_combo: Combobox = None
+
+    # The stack being analysed
+    stack_manager: StackManager = None
+
+    # Report tab
+    title_entry: Entry = None
+    author_entry: Entry = None
+    revision_entry: Entry = None
+    middle_frame: Frame = None
+    report_scroll_canvas: tk.Canvas = None
+    arrow_figure: plt.Figure = None
+    # The overall figure holds the overall histogram and, for radial stacks, the histogram of magnitudes
+    oal_figure: plt.Figure = None
+    oal_axes: plt.Axes = None
+    magnitude_axes: plt.Axes = None
+    mean_label: Label = None
+    median_label: Label = None
+    min_label: Label = None
+    max_label: Label = None
+    std_label: Label = None
+    cpk_label: Label = None
+    samples_label: Label = None
+    absolute_label: Label = None
+    percent_below_label: Label = None
+    percent_above_label: Label = None
+    percent_ok_label: Label = None
+    percent_nok_label: Label = None
+    custom_lower_entry_sv: tk.StringVar = None
+    custom_upper_entry_sv: tk.StringVar = None
+    percent_below_custom_label: Label = None
+    percent_above_custom_label: Label = None
+    percent_good_custom_label: Label = None
+    percent_bad_custom_label: Label = None
+    cust_cpk_label: Label = None
+    # The id of the pending update for a change to the custom limits, None if no update is pending
+    custom_limit_after_id: str = None
+
+    # The overall lengths shown in the report, kept so that custom limits can be applied without recalculating the
+    # stack
+    report_lengths: np.ndarray = None
+
+
+ui = UIState()
 
 
 def generate_interface():
@@ -39,27 +106,26 @@ def generate_interface():
     Creates the window and the interface within it
     :return:
     """
-    global table_frame, tab_control, root
-    root = tk.Tk()
-    root.title(TITLE)
-    root.iconbitmap("icon.ico")
-    root.geometry('1800x1200')
+    ui.root = tk.Tk()
+    ui.root.title(TITLE)
+    ui.root.iconbitmap("icon.ico")
+    ui.root.geometry('1800x1200')
 
     # Set the theme.
     # Credits to: https://github.com/rdbende/Sun-Valley-ttk-theme & https://github.com/quantumblacklabs/qbstyles
     # TKinter theme:
-    root.tk.call("source", "sun-valley.tcl")
-    root.tk.call("set_theme", "dark")
+    ui.root.tk.call("source", "sun-valley.tcl")
+    ui.root.tk.call("set_theme", "dark")
     # Matplotlib theme:
     mpl_style(dark=True)
 
-    tab_control = ttk.Notebook(root)
-    setup_frame = Frame(tab_control)
-    report_frame = Frame(tab_control)
-    tab_control.pack(fill="both", expand=1)
+    ui.tab_control = ttk.Notebook(ui.root)
+    setup_frame = Frame(ui.tab_control)
+    report_frame = Frame(ui.tab_control)
+    ui.tab_control.pack(fill="both", expand=1)
 
-    bold_style = ttk.Style()
-    bold_style.configure("Bold.TButton", font=('Sans', '12', 'bold'))
+    ui.bold_style = ttk.Style()
+    ui.bold_style.configure("Bold.TButton", font=('Sans', '12', 'bold'))
 
     _generate_setup_frame(setup_frame)
     _generate_report_frame(report_frame)
@@ -67,10 +133,10 @@ def generate_interface():
     setup_frame.pack()
     report_frame.pack()
 
-    tab_control.add(setup_frame, text='Setup')
-    tab_control.add(report_frame, text='Report')
+    ui.tab_control.add(setup_frame, text='Setup')
+    ui.tab_control.add(report_frame, text='Report')
 
-    root.mainloop()
+    ui.root.mainloop()
     sys.exit()
 
 
@@ -80,8 +146,6 @@ def _generate_setup_frame(setup_frame):
     :param setup_frame: The setup frame to be configured
     :return:
     """
-    global table_frame, oal_lsl_lref, oal_usl_limit_lref, stack_type_combo, setup_scroll_canvas, \
-        setup_scroll_canvas_frame
 
     top_frame = Frame(setup_frame)
     top_frame.pack(fill="x", pady=10)
@@ -98,21 +162,21 @@ def _generate_setup_frame(setup_frame):
 
     stack_type_frame = Frame(top_frame)
     Label(stack_type_frame, text="Stack Type:").pack(side="left", padx=5)
-    stack_type_combo = Combobox(stack_type_frame, values=("1-Dimensional Stack", "Radial Stack"), width=20,
-                                justify="center")
-    stack_type_combo.set("1-Dimensional Stack")
-    stack_type_combo.pack(side="left")
-    stack_type_combo.bind("<<ComboboxSelected>>", lambda event: _stack_type_change())
+    ui.stack_type_combo = Combobox(stack_type_frame, values=("1-Dimensional Stack", "Radial Stack"), width=20,
+                                   justify="center")
+    ui.stack_type_combo.set("1-Dimensional Stack")
+    ui.stack_type_combo.pack(side="left")
+    ui.stack_type_combo.bind("<<ComboboxSelected>>", lambda event: _stack_type_change())
     stack_type_frame.grid(row=0, column=1)
 
     spec_limits_frame = Frame(top_frame, width=100)
     spec_limits_frame.grid_columnconfigure(0, weight=1)
     spec_limits_frame.grid_columnconfigure(1, weight=1)
 
-    oal_lsl_lref = LabelRestrictedEntryFrame(spec_limits_frame, "Overall Lower Specification Limit")
-    oal_lsl_lref.grid(row=0, column=0)
-    oal_usl_limit_lref = LabelRestrictedEntryFrame(spec_limits_frame, "Overall Upper Specification Limit")
-    oal_usl_limit_lref.grid(row=0, column=1, padx=20)
+    ui.oal_lsl_lref = LabelRestrictedEntryFrame(spec_limits_frame, "Overall Lower Specification Limit")
+    ui.oal_lsl_lref.grid(row=0, column=0)
+    ui.oal_usl_limit_lref = LabelRestrictedEntryFrame(spec_limits_frame, "Overall Upper Specification Limit")
+    ui.oal_usl_limit_lref.grid(row=0, column=1, padx=20)
     spec_limits_frame.grid(row=0, column=2, sticky="e", padx=50)
 
     table_title_frame = Frame(setup_frame)
@@ -130,29 +194,29 @@ def _generate_setup_frame(setup_frame):
     table_frame_container.pack(fill="both")
 
     # Add a canvas in that frame.
-    setup_scroll_canvas = tk.Canvas(table_frame_container)
-    setup_scroll_canvas.pack(side="left", fill="x", expand=1)
+    ui.setup_scroll_canvas = tk.Canvas(table_frame_container)
+    ui.setup_scroll_canvas.pack(side="left", fill="x", expand=1)
 
-    table_frame = Frame(table_frame_container)
+    ui.table_frame = Frame(table_frame_container)
 
     # Create a vertical scrollbar linked to the canvas.
-    scroll_bar = ttk.Scrollbar(table_frame_container, orient=tk.VERTICAL, command=setup_scroll_canvas.yview)
+    scroll_bar = ttk.Scrollbar(table_frame_container, orient=tk.VERTICAL, command=ui.setup_scroll_canvas.yview)
 
     scroll_bar.pack(side="right", fill="y")
-    setup_scroll_canvas.configure(yscrollcommand=scroll_bar.set)
+    ui.setup_scroll_canvas.configure(yscrollcommand=scroll_bar.set)
 
-    setup_scroll_canvas_frame = setup_scroll_canvas.create_window((0, 0), window=table_frame, anchor="nw")
+    ui.setup_scroll_canvas_frame = ui.setup_scroll_canvas.create_window((0, 0), window=ui.table_frame, anchor="nw")
 
-    table_frame.bind("<Configure>", _on_frame_configure)
-    setup_scroll_canvas.bind('<Configure>', _update_scroll_canvas_width)
+    ui.table_frame.bind("<Configure>", _on_frame_configure)
+    ui.setup_scroll_canvas.bind('<Configure>', _update_scroll_canvas_width)
 
-    table_frame.update_idletasks()  # Needed to make bbox info available.
-    bbox = setup_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
+    ui.table_frame.update_idletasks()  # Needed to make bbox info available.
+    bbox = ui.setup_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
 
     # Define the scrollable region as entire canvas with only the desired width/height
-    setup_scroll_canvas.configure(scrollregion=bbox, height=850)
+    ui.setup_scroll_canvas.configure(scrollregion=bbox, height=850)
 
-    init_entry = StackRow(table_frame, init_entry=True)
+    init_entry = StackRow(ui.table_frame, init_entry=True)
     init_entry.pack(fill="x", expand=1)
     row_entries.append(init_entry)
 
@@ -189,11 +253,6 @@ def _generate_report_frame(report_frame):
     :param report_frame: The report frame to be configured
     :return:
     """
-    global arrow_figure, mean_label, median_label, min_label, max_label, samples_label, absolute_label, \
-        percent_below_label, percent_above_label, percent_ok_label, percent_nok_label, custom_lower_entry_sv, \
-        custom_upper_entry_sv, percent_below_custom_label, percent_above_custom_label, percent_good_custom_label, \
-        percent_bad_custom_label, arrow_figure, oal_figure, magnitude_figure, middle_frame, report_scroll_canvas, \
-        std_label, cpk_label, cust_cpk_label, title_entry, author_entry, revision_entry
 
     # Generate Header Row
     header_frame = Frame(report_frame)
@@ -204,21 +263,21 @@ def _generate_report_frame(report_frame):
 
     title_frame = ttk.Frame(header_frame)
     title_label = Label(title_frame, text="Title:", anchor="e")
-    title_entry = Entry(title_frame, width=20)
+    ui.title_entry = Entry(title_frame, width=20)
     title_label.pack(side="left", padx=5)
-    title_entry.pack(side="left")
+    ui.title_entry.pack(side="left")
 
     author_frame = ttk.Frame(header_frame)
     author_label = Label(author_frame, text="Author:", width=21, anchor="e")
-    author_entry = Entry(author_frame, width=20)
+    ui.author_entry = Entry(author_frame, width=20)
     author_label.pack(side="left", padx=5)
-    author_entry.pack(side="left")
+    ui.author_entry.pack(side="left")
 
     revision_frame = ttk.Frame(header_frame)
     revision_label = Label(revision_frame, text="Revision:", width=21, anchor="e")
-    revision_entry = Entry(revision_frame, width=20)
+    ui.revision_entry = Entry(revision_frame, width=20)
     revision_label.pack(side="left", padx=5)
-    revision_entry.pack(side="left")
+    ui.revision_entry.pack(side="left")
 
     title_frame.grid(row=0, column=0)
     author_frame.grid(row=0, column=1)
@@ -230,29 +289,29 @@ def _generate_report_frame(report_frame):
     mid_frame.pack()
 
     # Add a canvas in that frame.
-    report_scroll_canvas = tk.Canvas(mid_frame)
-    report_scroll_canvas.grid(row=0, column=0)
+    ui.report_scroll_canvas = tk.Canvas(mid_frame)
+    ui.report_scroll_canvas.grid(row=0, column=0)
 
     # Create a vertical scrollbar linked to the canvas.
-    scroll_bar = tk.Scrollbar(mid_frame, orient=tk.VERTICAL, command=report_scroll_canvas.yview)
+    scroll_bar = tk.Scrollbar(mid_frame, orient=tk.VERTICAL, command=ui.report_scroll_canvas.yview)
     scroll_bar.grid(row=0, column=1, sticky=tk.NS)
-    report_scroll_canvas.configure(yscrollcommand=scroll_bar.set)
+    ui.report_scroll_canvas.configure(yscrollcommand=scroll_bar.set)
 
     # Generate Middle Frame
-    middle_frame = Frame(report_scroll_canvas)
-    middle_frame.grid_columnconfigure(0, weight=1)
-    middle_frame.grid_columnconfigure(1, weight=1)
-    middle_frame.grid_rowconfigure(0, weight=1)
-    middle_frame.grid_rowconfigure(1, weight=1)
+    ui.middle_frame = Frame(ui.report_scroll_canvas)
+    ui.middle_frame.grid_columnconfigure(0, weight=1)
+    ui.middle_frame.grid_columnconfigure(1, weight=1)
+    ui.middle_frame.grid_rowconfigure(0, weight=1)
+    ui.middle_frame.grid_rowconfigure(1, weight=1)
 
     # Layout the arrow figure
-    arrow_figure = plt.figure(figsize=(10, 5))
-    figure_canvas = FigureCanvasTkAgg(arrow_figure, master=middle_frame)
+    ui.arrow_figure = plt.figure(figsize=(10, 5))
+    figure_canvas = FigureCanvasTkAgg(ui.arrow_figure, master=ui.middle_frame)
     figure_canvas.draw()
     figure_canvas.get_tk_widget().columnconfigure(0, weight=1)
     figure_canvas.get_tk_widget().grid(column=0, row=0)
 
-    data_summary_frame = Frame(middle_frame)
+    data_summary_frame = Frame(ui.middle_frame)
     data_summary_frame.grid_columnconfigure(0, weight=1)
     data_summary_frame.grid_columnconfigure(1, weight=1)
     data_summary_frame.grid_rowconfigure(0, weight=1)
@@ -270,84 +329,76 @@ def _generate_report_frame(report_frame):
                         font=("Arial bold", 15))
     title_label.grid(row=0, column=0, columnspan=2, sticky=tk.W + tk.E, pady=15)
 
-    mean_label = Label(data_summary_frame, text="Mean: ")
-    median_label = Label(data_summary_frame, text="Median: ")
-    mean_label.grid(row=1, column=0, pady=5, sticky="w")
-    median_label.grid(row=1, column=1, pady=5, sticky="w")
-
-    min_label = Label(data_summary_frame, text="Min: ")
-    max_label = Label(data_summary_frame, text="Max: ")
-    min_label.grid(row=2, column=0, pady=5, sticky="w")
-    max_label.grid(row=2, column=1, pady=5, sticky="w")
-
-    std_label = Label(data_summary_frame, text="Standard Deviation: ")
-    std_label.grid(row=3, column=0, pady=5, sticky="w")
-    cpk_label = Label(data_summary_frame, text="CPK: ")
-    cpk_label.grid(row=3, column=1, pady=5, sticky="w")
-
-    samples_label = Label(data_summary_frame, text="Number of Samples: ")
-    samples_label.grid(row=4, column=0, pady=5, sticky="w")
-    absolute_label = Label(data_summary_frame, text="Specification Limits: ")
-    absolute_label.grid(row=4, column=1, pady=5, sticky="w")
-
-    percent_below_label = Label(data_summary_frame, text="Percent Below Limit: ")
-    percent_above_label = Label(data_summary_frame, text="Percent Above Limit: ")
-    percent_below_label.grid(row=5, column=0, pady=5, sticky="w")
-    percent_above_label.grid(row=5, column=1, pady=5, sticky="w")
-
-    percent_ok_label = Label(data_summary_frame, text="Percent Within Limits: ")
-    percent_nok_label = Label(data_summary_frame, text="Percent Outside Limits: ")
-    percent_ok_label.grid(row=6, column=0, pady=5, sticky="w")
-    percent_nok_label.grid(row=6, column=1, pady=5, sticky="w")
-
-    custom_lower_entry_sv = tk.StringVar()
-    custom_lower_entry_sv.trace("w", lambda name, index, mode, sv=custom_lower_entry_sv: _populate_report_frame(
-        just_update_custom_limits=True))
+    ui.mean_label = Label(data_summary_frame, text="Mean: ")
+    ui.median_label = Label(data_summary_frame, text="Median: ")
+    ui.mean_label.grid(row=1, column=0, pady=5, sticky="w")
+    ui.median_label.grid(row=1, column=1, pady=5, sticky="w")
+
+    ui.min_label = Label(data_summary_frame, text="Min: ")
+    ui.max_label = Label(data_summary_frame, text="Max: ")
+    ui.min_label.grid(row=2, column=0, pady=5, sticky="w")
+    ui.max_label.grid(row=2, column=1, pady=5, sticky="w")
+
+    ui.std_label = Label(data_summary_frame, text="Standard Deviation: ")
+    ui.std_label.grid(row=3, column=0, pady=5, sticky="w")
+    ui.cpk_label = Label(data_summary_frame, text="CPK: ")
+    ui.cpk_label.grid(row=3, column=1, pady=5, sticky="w")
+
+    ui.samples_label = Label(data_summary_frame, text="Number of Samples: ")
+    ui.samples_label.grid(row=4, column=0, pady=5, sticky="w")
+    ui.absolute_label = Label(data_summary_frame, text="Specification Limits: ")
+    ui.absolute_label.grid(row=4, column=1, pady=5, sticky="w")
+
+    ui.percent_below_label = Label(data_summary_frame, text="Percent Below Limit: ")
+    ui.percent_above_label = Label(data_summary_frame, text="Percent Above Limit: ")
+    ui.percent_below_label.grid(row=5, column=0, pady=5, sticky="w")
+    ui.percent_above_label.grid(row=5, column=1, pady=5, sticky="w")
+
+    ui.percent_ok_label = Label(data_summary_frame, text="Percent Within Limits: ")
+    ui.percent_nok_label = Label(data_summary_frame, text="Percent Outside Limits: ")
+    ui.percent_ok_label.grid(row=6, column=0, pady=5, sticky="w")
+    ui.percent_nok_label.grid(row=6, column=1, pady=5, sticky="w")
+
+    ui.custom_lower_entry_sv = tk.StringVar()
+    ui.custom_lower_entry_sv.trace("w", lambda name, index, mode: _custom_limit_changed())
     lower_limit_entry = LabelRestrictedEntryFrame(data_summary_frame, "Custom Lower Limit: ",
-                                                  text_variable=custom_lower_entry_sv)
-    custom_upper_entry_sv = tk.StringVar()
-    custom_upper_entry_sv.trace("w", lambda name, index, mode, sv=custom_lower_entry_sv: _populate_report_frame(
-        just_update_custom_limits=True))
+                                                  text_variable=ui.custom_lower_entry_sv)
+    ui.custom_upper_entry_sv = tk.StringVar()
+    ui.custom_upper_entry_sv.trace("w", lambda name, index, mode: _custom_limit_changed())
     upper_limit_entry = LabelRestrictedEntryFrame(data_summary_frame, "Custom Upper Limit: ",
-                                                  text_variable=custom_upper_entry_sv)
+                                                  text_variable=ui.custom_upper_entry_sv)
     lower_limit_entry.grid(row=7, column=0, pady=20, sticky="w")
     upper_limit_entry.grid(row=7, column=1, pady=20, sticky="w")
 
-    percent_below_custom_label = Label(data_summary_frame, text="Percent Below Custom Limit: ")
-    percent_above_custom_label = Label(data_summary_frame, text="Percent Above Custom Limit: ")
-    percent_below_custom_label.grid(row=8, column=0, pady=5, sticky="w")
-    percent_above_custom_label.grid(row=8, column=1, pady=5, sticky="w")
+    ui.percent_below_custom_label = Label(data_summary_frame, text="Percent Below Custom Limit: ")
+    ui.percent_above_custom_label = Label(data_summary_frame, text="Percent Above Custom Limit: ")
+    ui.percent_below_custom_label.grid(row=8, column=0, pady=5, sticky="w")
+    ui.percent_above_custom_label.grid(row=8, column=1, pady=5, sticky="w")
 
-    percent_good_custom_label = Label(data_summary_frame, text="Percent Within Custom Limits: ")
-    percent_bad_custom_label = Label(data_summary_frame, text="Percent Outside Custom Limits: ")
-    percent_good_custom_label.grid(row=9, column=0, pady=5, sticky="w")
-    percent_bad_custom_label.grid(row=9, column=1, pady=5, sticky="w")
+    ui.percent_good_custom_label = Label(data_summary_frame, text="Percent Within Custom Limits: ")
+    ui.percent_bad_custom_label = Label(data_summary_frame, text="Percent Outside Custom Limits: ")
+    ui.percent_good_custom_label.grid(row=9, column=0, pady=5, sticky="w")
+    ui.percent_bad_custom_label.grid(row=9, column=1, pady=5, sticky="w")
 
-    cust_cpk_label = Label(data_summary_frame, text="CPK For Custom Limits: ")
-    cust_cpk_label.grid(row=10, column=0, pady=5, sticky="w")
+    ui.cust_cpk_label = Label(data_summary_frame, text="CPK For Custom Limits: ")
+    ui.cust_cpk_label.grid(row=10, column=0, pady=5, sticky="w")
 
     data_summary_frame.grid(column=1, row=0)
 
     # Layout the overall figure
-    oal_figure = plt.figure(figsize=(6, 5))
-    figure_canvas = FigureCanvasTkAgg(oal_figure, master=middle_frame)
-    middle_frame.columnconfigure(0, weight=1)
-    middle_frame.columnconfigure(1, weight=1)
-    figure_canvas.draw()
-    figure_canvas.get_tk_widget().grid(column=0, row=1, pady=10, ipady=10)
-
-    # Layout the magnitude figure
-    magnitude_figure = plt.figure(figsize=(7, 5))
-    figure_canvas = FigureCanvasTkAgg(magnitude_figure, master=middle_frame)
+    ui.oal_figure = plt.figure(figsize=(16, 5))
+    figure_canvas = FigureCanvasTkAgg(ui.oal_figure, master=ui.middle_frame)
+    ui.middle_frame.columnconfigure(0, weight=1)
+    ui.middle_frame.columnconfigure(1, weight=1)
     figure_canvas.draw()
-    figure_canvas.get_tk_widget().grid(column=1, row=1, pady=10, ipady=10)
+    figure_canvas.get_tk_widget().grid(column=0, row=1, columnspan=2, pady=10, ipady=10)
 
-    report_scroll_canvas.create_window((0, 0), window=middle_frame, anchor=tk.NW)
+    ui.report_scroll_canvas.create_window((0, 0), window=ui.middle_frame, anchor=tk.NW)
 
-    middle_frame.update_idletasks()
-    bbox = report_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
+    ui.middle_frame.update_idletasks()
+    bbox = ui.report_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
     # Define the scrollable region as entire canvas with only the desired width/height
-    report_scroll_canvas.configure(scrollregion=bbox, width=bbox[2], height=1050)
+    ui.report_scroll_canvas.configure(scrollregion=bbox, width=bbox[2], height=1050)
 
     footer_frame = Frame(report_frame)
     footer_frame.grid_columnconfigure(0, weight=1)
@@ -361,175 +412,182 @@ def _generate_report_frame(report_frame):
     footer_frame.pack(fill="x")
 
 
+def _custom_limit_changed():
+    """
+    Handles a custom limit being edited. The update of the report is delayed until typing pauses, so that it is only
+    updated once for a value rather than for every keystroke.
+    :return:
+    """
+    if ui.custom_limit_after_id is not None:
+        ui.root.after_cancel(ui.custom_limit_after_id)
+    ui.custom_limit_after_id = ui.root.after(_CUSTOM_LIMIT_DELAY, _custom_limit_delay_elapsed)
+
+
+def _custom_limit_delay_elapsed():
+    """
+    Updates the report once typing in a custom limit has paused
+    :return:
+    """
+    ui.custom_limit_after_id = None
+    _populate_report_frame(just_update_custom_limits=True)
+
+
 def _populate_report_frame(just_update_custom_limits=False):
     """
     Populates the report frame with data from the stack manager
     :param just_update_custom_limits: If True, only features related to the custom limits are updated
     :return:
     """
+    if not ui.stack_manager:
+        return
 
-    global stack_manager, arrow_figure, middle_frame, mean_label, median_label, min_label, max_label, samples_label, \
-        report_scroll_canvas, std_label, cpk_label, stack_type_combo, oal_figure, magnitude_figure
-
-    if not stack_manager:
+    if just_update_custom_limits:
+        # The stack hasn't changed, so the figures are left as they are and the lengths already shown are reused
+        if ui.report_lengths is not None:
+            custom_limits = _get_custom_limits()
+            summary_data = ui.stack_manager.update_custom_limits(custom_limits)
+            _update_custom_limit_labels(summary_data, custom_limits)
         return
 
-    radial_stack_bool = stack_type_combo.get() == "Radial Stack"
+    _refresh_report()
+
+
+def _refresh_report():
+    """
+    Recalculates the stack and updates all labels and figures of the report frame
+    :return:
+    """
+
+    radial_stack_bool = ui.stack_type_combo.get() == "Radial Stack"
     if radial_stack_bool:
-        stack_manager.one_d_stack = False
+        ui.stack_manager.one_d_stack = False
 
-    stack_manager.calculate_stack(radial_stack_bool)
-    lengths = stack_manager.calc_oal_dist()
+    ui.stack_manager.calculate_stack(radial_stack_bool)
+    lengths = ui.stack_manager.calc_oal_dist()
 
     if radial_stack_bool:
         # This is a radial stack, base off of magnitudes
         lengths = lengths_to_magnitudes(lengths)
+    ui.report_lengths = lengths
 
-    plt.clf()
-
-    custom_limits = None
-    try:
-        custom_limits = [float(custom_lower_entry_sv.get()), float(custom_upper_entry_sv.get())]
-    except Exception:
-        # Cant convert the entered values into limits
-        pass
-
-    summary_data = stack_manager.get_summary_data(lengths, cust_limits=custom_limits)
-
-    if summary_data.percent_below_cust_lsl is not None:
-        percent_below_custom_label.config(
-            text=f"Percent Below Custom Lower Limit: {round(summary_data.percent_below_cust_lsl, _DECIMAL_PLACES)}%")
-        percent_above_custom_label.config(
-            text=f"Percent Above Custom Upper Limit: {round(summary_data.percent_above_cust_usl, _DECIMAL_PLACES)}%")
-        percent_good_custom_label.config(
-            text=f"Percent Within Custom Limits: {round(summary_data.percent_cust_ok, _DECIMAL_PLACES)}%")
-        percent_bad_custom_label.config(
-            text=f"Percent Outside Custom Limits: {round(summary_data.percent_cust_nok, _DECIMAL_PLACES)}%")
-
-        cpk = get_cpk(custom_limits[0], custom_limits[1], lengths.mean(), np.std(lengths))
-        cust_cpk_label.config(text=f"CPK Given Custom Limits: {round(cpk, _DECIMAL_PLACES)}")
-
-    if just_update_custom_limits:
-        return
+    custom_limits = _get_custom_limits()
+    summary_data = ui.stack_manager.get_summary_data(lengths, cust_limits=custom_limits)
+    _update_custom_limit_labels(summary_data, custom_limits)
 
     # Update all labels
 
-    mean_label.config(text=f"Mean: {round(summary_data.mean, _DECIMAL_PLACES)}")
-    median_label.config(text=f"Median: {round(summary_data.median, _DECIMAL_PLACES)}")
-    min_label.config(text=f"Minimum: {round(summary_data.min, _DECIMAL_PLACES)}")
-    max_label.config(text=f"Maximum: {round(summary_data.max, _DECIMAL_PLACES)}")
-    std_label.config(text=f"Standard Deviation: {round(summary_data.std, _DECIMAL_PLACES)}")
-    samples_label.config(text=f"Number of Samples: {summary_data.samples}")
+    ui.mean_label.config(text=f"Mean: {summary_data.mean:.{_DECIMAL_PLACES}f}")
+    ui.median_label.config(text=f"Median: {summary_data.median:.{_DECIMAL_PLACES}f}")
+    ui.min_label.config(text=f"Minimum: {summary_data.min:.{_DECIMAL_PLACES}f}")
+    ui.max_label.config(text=f"Maximum: {summary_data.max:.{_DECIMAL_PLACES}f}")
+    ui.std_label.config(text=f"Standard Deviation: {summary_data.std:.{_DECIMAL_PLACES}f}")
+    ui.samples_label.config(text=f"Number of Samples: {summary_data.samples}")
     if summary_data.target_limits and summary_data.target_limits[0] is not None and \
             summary_data.target_limits[1] is not None:
-        absolute_label.config(text=f"Specification Limits:  {summary_data.target_limits}")
-        percent_below_label.config(
-            text=f"Percent Below Lower Specification Limit: {round(summary_data.percent_below_lsl, _DECIMAL_PLACES)}%")
-        percent_above_label.config(
-            text=f"Percent Above Upper Specification Limit: {round(summary_data.percent_above_usl, _DECIMAL_PLACES)}%")
-        percent_ok_label.config(
-            text=f"Percent Within Specification Limits: {round(summary_data.percent_ok, _DECIMAL_PLACES)}%")
-        percent_nok_label.config(
-            text=f"Percent Outside Specification Limits: {round(summary_data.percent_nok, _DECIMAL_PLACES)}%")
-        cpk_label.config(text=f"CPK: {round(summary_data.cpk, _DECIMAL_PLACES)}")
+        ui.absolute_label.config(text=f"Specification Limits:  {summary_data.target_limits}")
+        ui.percent_below_label.config(
+            text=f"Percent Below Lower Specification Limit: {summary_data.percent_below_lsl:.{_DECIMAL_PLACES}f}%")
+        ui.percent_above_label.config(
+            text=f"Percent Above Upper Specification Limit: {summary_data.percent_above_usl:.{_DECIMAL_PLACES}f}%")
+        ui.percent_ok_label.config(
+            text=f"Percent Within Specification Limits: {summary_data.percent_ok:.{_DECIMAL_PLACES}f}%")
+        ui.percent_nok_label.config(
+            text=f"Percent Outside Specification Limits: {summary_data.percent_nok:.{_DECIMAL_PLACES}f}%")
+        ui.cpk_label.config(text=f"CPK: {summary_data.cpk:.{_DECIMAL_PLACES}f}")
 
     else:
-        absolute_label.config(text=f"Specification Limits: Not Defined")
+        ui.absolute_label.config(text=f"Specification Limits: Not Defined")
 
     # Update arrow diagram
-    arrow_figure.clf()
-    arrow_figure.set_facecolor(_MPL_BACKGROUND)
-    stack_manager.create_arrow_diagram(arrow_figure.gca())
-    arrow_figure.canvas.draw()
-    arrow_figure.canvas.flush_events()
-
-    # Create summaries for each stackup step
-    for stackup_it in enumerate(stack_manager.stackup_steps):
-        row = stackup_it[0] + 2
-        middle_frame.grid_rowconfigure(row, weight=1)
-        lengths = stackup_it[1].lengths
-
-        # Create histogram
-        hist_figure = plt.figure(figsize=(10, 5))
-        figure_canvas = FigureCanvasTkAgg(hist_figure, master=middle_frame)
-        figure_canvas.draw()
-        figure_canvas.get_tk_widget().grid(column=0, row=row, pady=30, ipady=50)
-        hist_figure.set_facecolor(_MPL_BACKGROUND)
-        hist_figure = StackManager.create_oal_diagram(None, hist_figure.gca(), lengths, radial_stack=radial_stack_bool)
-        hist_figure.set_title(f"Distribution Of Part: {stackup_it[1].part_name}, {stackup_it[1].description}")
-        stackup_it[1].image = _get_axis_image(hist_figure)
-
-        summary_table = Frame(middle_frame)
-        summary_table.grid_columnconfigure(0, weight=1)
-        summary_table.grid_columnconfigure(1, weight=1)
-        summary_table.grid_rowconfigure(0, weight=1)
-        summary_table.grid_rowconfigure(1, weight=1)
-        summary_table.grid_rowconfigure(2, weight=1)
-        summary_table.grid_rowconfigure(3, weight=1)
-
-        if radial_stack_bool:
-            # This is a radial stack, base off of magnitudes
-            lengths = lengths_to_magnitudes(lengths)
-
-        title_label = Label(summary_table, text=f"Summary For Part: {stackup_it[1].part_name}, "
-                                                f"{stackup_it[1].description} ", justify="center", anchor="center",
-                            font=("Arial bold", 12))
-        title_label.grid(row=0, column=0, columnspan=2, sticky=tk.W + tk.E, pady=15)
+    ui.arrow_figure.clf()
+    ui.arrow_figure.set_facecolor(_MPL_BACKGROUND)
+    ui.stack_manager.create_arrow_diagram(ui.arrow_figure.gca())
+    ui.arrow_figure.canvas.draw()
 
-        Label(summary_table, text=f"Mean: {round(lengths.mean(), 2)}").grid(row=1, column=0, pady=5, sticky="w")
-        Label(summary_table, text=f"Median: {round(np.median(lengths), 2)}").grid(row=1, column=1, pady=5,
-                                                                                  sticky="w")
+    # Update the summaries for each stackup step, only creating widgets for steps that didn't have them
+    for i, stackup_step in enumerate(ui.stack_manager.stackup_steps):
+        if i == len(step_reports):
+            row = i + 2
+            ui.middle_frame.grid_rowconfigure(row, weight=1)
+            step_reports.append(StepReport(ui.middle_frame, row))
 
-        Label(summary_table, text=f"Min: {round(min(lengths), 2)}").grid(row=2, column=0, pady=5, sticky="w")
-        Label(summary_table, text=f"Max: {round(max(lengths), 2)}").grid(row=2, column=1, pady=5, sticky="w")
+        step_reports[i].update(stackup_step, radial_stack_bool)
 
-        Label(summary_table, text=f"Number of Samples: {round(stackup_it[1].distribution.num_samples, 2)}").grid \
-            (row=3, column=0, pady=5, sticky="w")
+    # Remove the summaries of steps that are no longer in the stack
+    while len(step_reports) > len(ui.stack_manager.stackup_steps):
+        step_reports.pop().destroy()
 
-        summary_table.grid(column=1, row=row, pady=10)
-
-        figure_canvas.draw()
-        figure_canvas.flush_events()
+    # Update the overall figure, splitting it between the overall and magnitude histograms for radial stacks
+    ui.oal_figure.clf()
+    ui.oal_figure.set_facecolor(_MPL_BACKGROUND)
 
     if radial_stack_bool:
-        # Need to resize figures, thus create a new oal figure
-        oal_figure.clf()
-        oal_figure.canvas.get_tk_widget().grid_remove()
-        oal_figure = plt.figure(figsize=(6, 5))
-        figure_canvas = FigureCanvasTkAgg(oal_figure, master=middle_frame)
-        figure_canvas.get_tk_widget().columnconfigure(0, weight=1)
-        figure_canvas.get_tk_widget().columnconfigure(1, weight=1)
-        oal_figure.canvas.get_tk_widget().grid(column=0, row=1, columnspan=1, ipady=40)
-        stack_manager.create_oal_diagram(oal_figure.gca())
-        oal_figure.gca().set_title("Overall Stackup Result")
-
-        magnitude_figure.clf()
-        magnitude_figure.set_facecolor(_MPL_BACKGROUND)
-        magnitude_figure.canvas.get_tk_widget().grid(column=1, row=1, ipady=10)
-        stack_manager.create_magnitude_diagram(magnitude_figure.gca())
-        magnitude_figure.canvas.draw()
-        magnitude_figure.canvas.flush_events()
+        grid_spec = ui.oal_figure.add_gridspec(1, 2, width_ratios=_RADIAL_WIDTH_RATIOS)
+        # The overall axes are created as polar axes, so the radial diagram doesn't need to replace them
+        oal_axes = ui.oal_figure.add_subplot(grid_spec[0, 0], projection="polar")
+        ui.oal_axes = ui.stack_manager.create_oal_diagram(oal_axes)
+        ui.oal_axes.set_title("Overall Stackup Result")
+        ui.magnitude_axes = ui.stack_manager.create_magnitude_diagram(ui.oal_figure.add_subplot(grid_spec[0, 1]))
 
     else:
-        oal_figure.clf()
-        oal_figure.canvas.get_tk_widget().grid_remove()
-        oal_figure = plt.figure(figsize=(16, 5))
-        figure_canvas = FigureCanvasTkAgg(oal_figure, master=middle_frame)
-        figure_canvas.get_tk_widget().columnconfigure(0, weight=1)
-        oal_figure.canvas.get_tk_widget().grid(column=0, row=1, columnspan=2, pady=10, ipady=10)
-        stack_manager.create_oal_diagram(oal_figure.gca())
-        oal_figure.gca().set_title("Histogram Of Stackup Result")
-
-        magnitude_figure.clf()
-        magnitude_figure.canvas.get_tk_widget().grid_remove()
-
-    oal_figure.set_facecolor(_MPL_BACKGROUND)
-    oal_figure.canvas.draw()
-    oal_figure.canvas.flush_events()
+        ui.oal_axes = ui.stack_manager.create_oal_diagram(ui.oal_figure.add_subplot())
+        ui.oal_axes.set_title("Histogram Of Stackup Result")
+        ui.magnitude_axes = None
+
+    ui.oal_figure.canvas.draw()
+
+    # Lay out all of the changes to the report at once, rather than after each figure, before measuring it
+    ui.middle_frame.update_idletasks()
 
     # Update the frame/scrollbar to reflect the frame
-    bbox = report_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
-    report_scroll_canvas.configure(scrollregion=bbox, width=bbox[2], height=1000)
+    bbox = ui.report_scroll_canvas.bbox(tk.ALL)  # Get bounding box of canvas
+    ui.report_scroll_canvas.configure(scrollregion=bbox, width=bbox[2], height=1000)
+
+
+def _close_figure(figure):
+    """
+    Removes a figure from the report frame, destroying its widget and closing it so that pyplot releases it
+    :param figure: The figure to close
+    :return:
+    """
+    figure.canvas.get_tk_widget().destroy()
+    plt.close(figure)
+
+
+def _get_custom_limits():
+    """
+    Gets the custom limits entered in the report frame
+    :return: A list of the custom lower and upper limits, or None if valid limits have not been entered
+    """
+    try:
+        return [float(ui.custom_lower_entry_sv.get()), float(ui.custom_upper_entry_sv.get())]
+    except ValueError:
+        # Cant convert the entered values into limits
+        return None
+
+
+def _update_custom_limit_labels(summary_data, custom_limits):
+    """
+    Updates the labels of the report frame that depend on the custom limits
+    :param summary_data: The summary data of the overall lengths of the stack, calculated with the custom limits
+    :param custom_limits: The custom lower and upper limits, or None if they have not been entered
+    :return:
+    """
+    if summary_data.percent_below_cust_lsl is None:
+        return
+
+    ui.percent_below_custom_label.config(
+        text=f"Percent Below Custom Lower Limit: {summary_data.percent_below_cust_lsl:.{_DECIMAL_PLACES}f}%")
+    ui.percent_above_custom_label.config(
+        text=f"Percent Above Custom Upper Limit: {summary_data.percent_above_cust_usl:.{_DECIMAL_PLACES}f}%")
+    ui.percent_good_custom_label.config(
+        text=f"Percent Within Custom Limits: {summary_data.percent_cust_ok:.{_DECIMAL_PLACES}f}%")
+    ui.percent_bad_custom_label.config(
+        text=f"Percent Outside Custom Limits: {summary_data.percent_cust_nok:.{_DECIMAL_PLACES}f}%")
+
+    # The mean and standard deviation have already been calculated in the summary data
+    cpk = get_cpk(custom_limits[0], custom_limits[1], summary_data.mean, summary_data.std)
+    ui.cust_cpk_label.config(text=f"CPK Given Custom Limits: {cpk:.{_DECIMAL_PLACES}f}")
 
 
 def add_report_images():
@@ -538,7 +596,7 @@ def add_report_images():
     :return:
     """
     filename = filedialog.askopenfilenames(title="Select file", filetypes=[("Image files", ".png .jpg")])
-    stack_manager.add_report_image_paths(filename)
+    ui.stack_manager.add_report_image_paths(filename)
 
 
 def _update_scroll_canvas_width(event):
@@ -548,11 +606,11 @@ def _update_scroll_canvas_width(event):
     :return:
     """
     canvas_width = event.width
-    setup_scroll_canvas.itemconfig(setup_scroll_canvas_frame, width=canvas_width)
+    ui.setup_scroll_canvas.itemconfig(ui.setup_scroll_canvas_frame, width=canvas_width)
 
 
 def _on_frame_configure(_):
-    setup_scroll_canvas.configure(scrollregion=setup_scroll_canvas.bbox("all"))
+    ui.setup_scroll_canvas.configure(scrollregion=ui.setup_scroll_canvas.bbox("all"))
 
 
 def _save_pressed():
@@ -566,12 +624,11 @@ def _save_pressed():
     filename = filedialog.asksaveasfilename(title="Select file",
                                             filetypes=(("Pickle", "*.pickle"), ("all files", "*.*")))
     # Add file name to end if not there
-    if filename[-7:] != ".pickle":
+    if not filename.lower().endswith(".pickle"):
         filename += ".pickle"
 
-    file = open(filename, "ab")
-    pickle.dump(stack_manager, file)
-    file.close()
+    with open(filename, "wb", buffering=_FILE_BUFFER_SIZE) as file:
+        pickle.dump(ui.stack_manager, file, protocol=_PICKLE_PROTOCOL)
 
 
 def _load_pressed():
@@ -579,18 +636,20 @@ def _load_pressed():
     Loads the data from a file, saves it into the stack manager, and updates the display
     :return:
     """
-    global stack_manager
 
     # Load the data
     filename = filedialog.askopenfilename(title="Select file", filetypes=(("Pickle", "*.pickle"), ("all files", "*.*")))
-    file = open(filename, 'rb')
-    stack_manager = pickle.load(file)
+    with open(filename, "rb", buffering=_FILE_BUFFER_SIZE) as file:
+        ui.stack_manager = pickle.load(file)
+    ui.report_lengths = None
 
     # Update the setup interface
     # Clear the current list
     for row_entry in row_entries:
-        row_entries.remove(row_entry)
         row_entry.destroy()
+    row_entries.clear()
+    # Lay out the emptied table once, rather than once for each destroyed row
+    ui.table_frame.update_idletasks()
 
     _generate_stackup_steps()
 
@@ -602,10 +661,10 @@ def _stack_type_change():
     """
 
     # Add or removes the lower limit if the stack type has changed
-    if stack_type_combo.get() == "Radial Stack":
-        oal_lsl_lref.grid_remove()
+    if ui.stack_type_combo.get() == "Radial Stack":
+        ui.oal_lsl_lref.grid_remove()
     else:
-        oal_lsl_lref.grid(row=0, column=0)
+        ui.oal_lsl_lref.grid(row=0, column=0)
 
 
 def _create_report_pressed():
@@ -616,11 +675,12 @@ def _create_report_pressed():
     filename = filedialog.asksaveasfilename(title="Select file", filetypes=(("PDF", "*.pdf"), ("all files", "*.*")))
 
     # Add pdf to end if it's not already there
-    if filename[-4:] != ".pdf":
+    if not filename.lower().endswith(".pdf"):
         filename += ".pdf"
 
     image_list = _get_standard_plot_images()
-    report_generator = ReportGenerator(stack_manager, title_entry.get(), author_entry.get(), revision_entry.get())
+    report_generator = ReportGenerator(ui.stack_manager, ui.title_entry.get(), ui.author_entry.get(),
+                                       ui.revision_entry.get())
     report_generator.create_report(filename, image_list)
 
 
@@ -629,24 +689,35 @@ def _get_standard_plot_images():
     Gets the standard images for the plots
     :return: A list of images
     """
-    image_list = [_get_axis_image(arrow_figure), _get_axis_image(oal_figure)]
+    image_list = [_get_axis_image(ui.arrow_figure.gca()), _get_axis_image(ui.oal_axes)]
 
-    if stack_type_combo.get() == "Radial Stack":
-        image_list.append(_get_axis_image(magnitude_figure))
+    if ui.magnitude_axes is not None:
+        image_list.append(_get_axis_image(ui.magnitude_axes))
 
     return image_list
 
 
 def _get_axis_image(axs):
     """
-    Creates an image of a given matplotlib axis
+    Creates an image of a given matplotlib axis, cropped from its figure. The figure is left open, as it is still
+    displayed.
     :param axs: The axis to create an image for
     :return: The image representing the plot
     """
+    figure = axs.get_figure()
+    # Render the figure once and crop its buffer, as saving with a tight bounding box renders the figure twice
+    figure.canvas.draw()
+    pixels = np.asarray(figure.canvas.buffer_rgba())
+
+    # Crop to the axis and its labels, as the figure may hold other axes. Pixel rows count down from the top.
+    bbox = axs.get_tightbbox(figure.canvas.get_renderer()).padded(_IMAGE_PAD_INCHES * figure.dpi)
+    height, width = pixels.shape[:2]
+    pixels = pixels[max(int(height - bbox.y1), 0):min(int(np.ceil(height - bbox.y0)), height),
+                    max(int(bbox.x0), 0):min(int(np.ceil(bbox.x1)), width)]
+
     image_data = BytesIO()
-    axs.get_figure().savefig(image_data, format='png', bbox_inches='tight')
+    Image.fromarray(pixels).save(image_data, format='PNG')
     image_data.seek(0)
-    plt.close()
     return image_data
 
 
@@ -656,12 +727,12 @@ def _add_part_pressed():
     :return:
     """
     # Create an interface row
-    interface_entry = StackRow(table_frame, True)
+    interface_entry = StackRow(ui.table_frame, True)
     interface_entry.pack(fill="x")
     row_entries.append(interface_entry)
 
     # Create a part row
-    part_entry = StackRow(table_frame, False, mating_interface=interface_entry)
+    part_entry = StackRow(ui.table_frame, False, mating_interface=interface_entry)
     part_entry.pack(fill="x")
     row_entries.append(part_entry)
 
@@ -672,7 +743,7 @@ def _calculate_button_pressed():
     :return:
     """
     _generate_stack_manager()
-    tab_control.select(1)
+    ui.tab_control.select(1)
     _populate_report_frame()
 
 
@@ -682,73 +753,60 @@ def _generate_stackup_steps():
     :return:
     """
     prior_part = None
+    prior_step = None
     inner_row = 0
 
-    for stackup_step in enumerate(stack_manager.stackup_steps):
+    for stackup_step in ui.stack_manager.stackup_steps:
+        distribution = stackup_step.distribution
+        description = stackup_step.description
+        part_name = stackup_step.part_name
+        is_interface = stackup_step.is_interface
 
         # Generate Values & Text Arrays for lref
-        if stackup_step[1].distribution.name == "Normal":
-            text = StackRow.NORMAL_TEXT
-            combo_text = "Normal Distribution"
-            values = [stackup_step[1].distribution.mean, stackup_step[1].distribution.std,
-                      stackup_step[1].distribution.lower_lim,
-                      stackup_step[1].distribution.upper_lim, None]
-
-        elif stackup_step[1].distribution.name == "Uniform":
-            combo_text = "Uniform Distribution"
-            text = StackRow.UNIFORM_TEXT
-            values = [stackup_step[1].distribution.lower_lim, stackup_step[1].distribution.upper_lim, None, None, None]
-        elif stackup_step[1].distribution.name == "Skewed Normal":
-            combo_text = "Skewed Distribution"
-            text = StackRow.SKEW_TEXT
-            values = [stackup_step[1].distribution.mean, stackup_step[1].distribution.std,
-                      stackup_step[1].distribution.skew,
-                      stackup_step[1].distribution.lower_lim, stackup_step[1].distribution.upper_lim]
-        else:
+        display = _DISTRIBUTION_DISPLAY.get(distribution.name)
+        if display is None:
             raise ValueError('Distribution has an unaccounted for value')
-
-        description = stackup_step[1].description
-        part_name = stackup_step[1].part_name
+        combo_text, get_values = display
+        text = StackRow.COMBO_TEXT[combo_text]
+        values = get_values(distribution)
 
         if len(row_entries) == 0:  # First entry
-            row_entry = StackRow(table_frame, init_entry=True)
+            row_entry = StackRow(ui.table_frame, init_entry=True)
             prior_part = row_entry
             row_entry.set_lref_values(description, part_name, text, values, inner_row)
             row_entry.pack(fill="x")
             row_entries.append(row_entry)
-            row_entries[-1].dist_combo[inner_row].delete(0, "end")
-            row_entries[-1].dist_combo[inner_row].insert(0, combo_text)
+            row_entries[-1].dist_combo[inner_row].set(combo_text)
 
-        elif stackup_step[1].is_interface:
+        elif is_interface:
             inner_row = 0
-            row_entry = StackRow(table_frame, stackup_step[1].is_interface, mating_interface=prior_part)
+            row_entry = StackRow(ui.table_frame, is_interface, mating_interface=prior_part)
             row_entry.set_lref_values(description, part_name, text, values, inner_row)
             row_entry.pack(fill="x")
             row_entries.append(row_entry)
-            row_entries[-1].dist_combo[inner_row].delete(0, "end")
-            row_entries[-1].dist_combo[inner_row].insert(0, combo_text)
+            row_entries[-1].dist_combo[inner_row].set(combo_text)
 
         else:
-            if stack_manager.stackup_steps[stackup_step[0] - 1].part_name == stackup_step[1].part_name:
+            if prior_step.part_name == part_name:
                 inner_row += 1
                 # Add a row, don't make a new entry (it's still the same part)
                 row_entries[-1].add_inner_row()
                 row_entries[-1].set_lref_values(description, part_name, text, values, inner_row)
-                row_entries[-1].dist_combo[inner_row].delete(0, "end")
-                row_entries[-1].dist_combo[inner_row].insert(0, combo_text)
+                row_entries[-1].dist_combo[inner_row].set(combo_text)
 
             else:
                 inner_row = 0
                 if row_entries[-1].is_interface:
-                    prior_part = stackup_step[1]
+                    prior_part = stackup_step
 
                 # Create a new row entry
-                row_entry = StackRow(table_frame, stackup_step[1].is_interface)
+                row_entry = StackRow(ui.table_frame, is_interface)
                 row_entry.set_lref_values(description, part_name, text, values, inner_row)
                 row_entry.pack(fill="x")
                 row_entries.append(row_entry)
-                row_entries[-1].dist_combo[inner_row].delete(0, "end")
-                row_entries[-1].dist_combo[inner_row].insert(0, combo_text)
+                row_entries[-1].dist_combo[inner_row].set(combo_text)
+
+        prior_step = stackup_step
 
 
 def _generate_stack_manager():
@@ -756,9 +814,9 @@ def _generate_stack_manager():
     Creates the stackup manager given the rows currently within the interface
     :return:
     """
-    global stack_manager
     # Create a Stack Manager and items
-    stack_manager = StackManager()
+    ui.stack_manager = StackManager()
+    ui.report_lengths = None
 
     for row_entry in row_entries:
         part_name = row_entry.part_entry.get()
@@ -766,43 +824,133 @@ def _generate_stack_manager():
             description_name = row_entry.description_entry[stackup_step_it].get()
 
             # Generate Values Array
-            values = np.zeros(5)
+            values = [0.0] * 5
             for lref_it in enumerate(row_entry.lr_list[stackup_step_it]):
                 try:
                     values[lref_it[0]] = float(lref_it[1].get_text())
                 except ValueError:
                     continue
 
-            if row_entry.dist_combo[stackup_step_it].get() == "Normal Distribution":
-                distribution = distributions.Normal(values[0], values[1], lower_lim=values[2], upper_lim=values[3])
-
-            elif row_entry.dist_combo[stackup_step_it].get() == "Uniform Distribution":
-                distribution = distributions.Uniform(nominal=(values[0] + values[1]) / 2,
-                                                     tolerance=(values[1] - values[0]) / 2)
-                pass
-            elif row_entry.dist_combo[stackup_step_it].get() == "Skewed Distribution":
-                distribution = distributions.SkewedNormal(skew=values[2], mean=values[0],
-                                                          std=values[1], lower_lim=values[3], upper_lim=values[4])
-            elif row_entry.dist_combo[stackup_step_it].get() == "No Stack Contribution":
+            lrefs = row_entry.lr_list[stackup_step_it]
+
+            combo_text = row_entry.dist_combo[stackup_step_it].get()
+            if combo_text == "No Stack Contribution":
                 continue
-            else:
+
+            create_distribution = _DISTRIBUTION_CONSTRUCTORS.get(combo_text)
+            if create_distribution is None:
                 raise ValueError('Combobox has an unaccounted for value')
+            distribution = create_distribution(values, lrefs)
 
             stackup_step = StackupStep(part_name=part_name, description=description_name, distribution=distribution,
                                        is_interface=row_entry.is_interface)
 
-            stack_manager.add_part(stackup_step)
+            ui.stack_manager.add_part(stackup_step)
 
     try:
-        stack_manager.oal_lsl = float(oal_lsl_lref.get_text())
+        ui.stack_manager.oal_lsl = float(ui.oal_lsl_lref.get_text())
     except ValueError:
         pass  # The entry does not have a valid limit
     try:
-        stack_manager.oal_usl = float(oal_usl_limit_lref.get_text())
+        ui.stack_manager.oal_usl = float(ui.oal_usl_limit_lref.get_text())
     except ValueError:
         pass  # The entry does not have a valid limit
 
-    return stack_manager
+    return ui.stack_manager
+
+
+def _summarize(lengths):
+    """
+    Calculates the statistics shown in the summary of a stackup step, using numpy's reductions rather than python's
+    builtins, which iterate over the array one element at a time
+    :param lengths: A numpy array of lengths
+    :return: A tuple of the mean, median, minimum and maximum of the lengths
+    """
+    return lengths.mean(), np.median(lengths), lengths.min(), lengths.max()
+
+
+def _get_cutoff(lref):
+    """
+    Gets a cutoff from the entry of a LabelRestrictedEntryFrame
+    :param lref: The LabelRestrictedEntryFrame the cutoff is entered in
+    :return: The cutoff, or None if no cutoff has been entered
+    """
+    try:
+        return float(lref.get_text())
+    except ValueError:
+        return None
+
+
+def _normal_values(distribution):
+    """
+    Gets the values to display in the entries of a stack row for a normal distribution
+    :param distribution: The normal distribution
+    :return: A list of values, one for each entry
+    """
+    return [distribution.mean, distribution.std, distribution.lower_lim, distribution.upper_lim, None]
+
+
+def _uniform_values(distribution):
+    """
+    Gets the values to display in the entries of a stack row for a uniform distribution
+    :param distribution: The uniform distribution
+    :return: A list of values, one for each entry
+    """
+    return [distribution.lower_lim, distribution.upper_lim, None, None, None]
+
+
+def _skewed_normal_values(distribution):
+    """
+    Gets the values to display in the entries of a stack row for a skewed normal distribution
+    :param distribution: The skewed normal distribution
+    :return: A list of values, one for each entry
+    """
+    return [distribution.mean, distribution.std, distribution.skew, distribution.lower_lim, distribution.upper_lim]
+
+
+def _create_normal(values, lrefs):
+    """
+    Creates a normal distribution from the entries of a stack row
+    :param values: The values of the entries
+    :param lrefs: The LabelRestrictedEntryFrames of the entries
+    :return: The normal distribution
+    """
+    return distributions.Normal(values[0], values[1], lower_lim=_get_cutoff(lrefs[2]), upper_lim=_get_cutoff(lrefs[3]))
+
+
+def _create_uniform(values, lrefs):
+    """
+    Creates a uniform distribution from the entries of a stack row
+    :param values: The values of the entries
+    :param lrefs: The LabelRestrictedEntryFrames of the entries
+    :return: The uniform distribution
+    """
+    return distributions.Uniform(nominal=(values[0] + values[1]) / 2, tolerance=(values[1] - values[0]) / 2)
+
+
+def _create_skewed_normal(values, lrefs):
+    """
+    Creates a skewed normal distribution from the entries of a stack row
+    :param values: The values of the entries
+    :param lrefs: The LabelRestrictedEntryFrames of the entries
+    :return: The skewed normal distribution
+    """
+    return distributions.SkewedNormal(skew=values[2], mean=values[0], std=values[1], lower_lim=_get_cutoff(lrefs[3]),
+                                      upper_lim=_get_cutoff(lrefs[4]))
+
+
+# The combobox option of each distribution and the function getting the values of its entries, by distribution name
+_DISTRIBUTION_DISPLAY = {
+    "Normal": ("Normal Distribution", _normal_values),
+    "Uniform": ("Uniform Distribution", _uniform_values),
+    "Skewed Normal": ("Skewed Distribution", _skewed_normal_values),
+}
+# The function creating the distribution selected by each combobox option
+_DISTRIBUTION_CONSTRUCTORS = {
+    "Normal Distribution": _create_normal,
+    "Uniform Distribution": _create_uniform,
+    "Skewed Distribution": _create_skewed_normal,
+}
 
 
 class RestrictedEntry(tk.Entry):
@@ -824,14 +972,18 @@ class RestrictedEntry(tk.Entry):
         :param args:
         :return:
         """
+        value = self.get()
+        # An empty entry or a lone minus sign are allowed while typing, but aren't floats
+        if value == "" or value == "-":
+            return
+
         try:
-            float(self.get())
+            float(value)
             # The current value is a valid float
-            self.old_value = self.get()
+            self.old_value = value
         except ValueError:
             # Not a valid float -> reject
-            if self.get() != "" and self.get() != "-":
-                self.set(self.old_value)
+            self.set(self.old_value)
 
 
 class LabelRestrictedEntryFrame(ttk.Frame):
@@ -839,22 +991,34 @@ class LabelRestrictedEntryFrame(ttk.Frame):
     A combination of a label and a restricted entry, placed abutting each other
     """
 
-    def __init__(self, master=None, text="", text_variable=None, **kwargs):
+    def __init__(self, master=None, text="", text_variable=None, visible=True, **kwargs):
+        """
+        :param master:
+        :param text: The text of the label
+        :param text_variable: The variable holding the text of the entry. Optional
+        :param visible: Whether the label and entry are shown once created, rather than placed and then hidden
+        :param kwargs:
+        """
         Frame.__init__(self, master, **kwargs)
         self.label_text = tk.StringVar()
         self.label_text.set(text)
+        # The label text and visibility are kept, so that setting them to what they already are does nothing
+        self._text = text
+        self._visible = False
+        # Whether the elements have been given their grid options, which are kept while they are hidden
+        self._placed = False
 
         self.label = Label(self, textvariable=self.label_text, justify="right", anchor="e")
         self.spacer = Frame(self, width=5, height=30)
         self.restricted_entry = RestrictedEntry(self, width=10, text_variable=text_variable)
-        self.restricted_entry.insert(0, "TEXT")
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
         self.grid_columnconfigure(2, weight=1)
 
-        self.show()
+        if visible:
+            self.show()
 
     def set_text(self, text):
         """
@@ -862,6 +1026,9 @@ class LabelRestrictedEntryFrame(ttk.Frame):
         :param text: The text that the label should display
         :return: None
         """
+        if text == self._text:
+            return
+        self._text = text
         self.label_text.set(text)
 
     def set_value(self, value):
@@ -870,7 +1037,9 @@ class LabelRestrictedEntryFrame(ttk.Frame):
         :param value: The text that the label should display
         :return: None
         """
-        self.restricted_entry.set(value)
+        # Setting the entry runs its validation, so it is only set if it would change
+        if self.restricted_entry.get() != str(value):
+            self.restricted_entry.set(value)
 
     def get_text(self):
         """
@@ -884,18 +1053,32 @@ class LabelRestrictedEntryFrame(ttk.Frame):
         Hides the elements of the LabelRestrictedEntryFrame
         :return:
         """
-        self.label.grid_forget()
-        self.spacer.grid_forget()
-        self.restricted_entry.grid_forget()
+        if not self._visible:
+            return
+        self._visible = False
+        # The grid options are kept, so that the elements can be shown again without respecifying them
+        self.label.grid_remove()
+        self.spacer.grid_remove()
+        self.restricted_entry.grid_remove()
 
     def show(self):
         """
         Shows and places appropriately the elements of the LabelRestrictedEntryFrame
         :return:
         """
-        self.label.grid(row=0, column=0, sticky ="nsew")
-        self.spacer.grid(row=0, column=1, sticky ="nsew")
-        self.restricted_entry.grid(row=0, column=2, sticky ="nsew")
+        if self._visible:
+            return
+        self._visible = True
+
+        if self._placed:
+            self.label.grid()
+            self.spacer.grid()
+            self.restricted_entry.grid()
+        else:
+            self._placed = True
+            self.label.grid(row=0, column=0, sticky ="nsew")
+            self.spacer.grid(row=0, column=1, sticky ="nsew")
+            self.restricted_entry.grid(row=0, column=2, sticky ="nsew")
 
 
 class StackRow(tk.Frame):
@@ -903,13 +1086,16 @@ class StackRow(tk.Frame):
     A class containing all interface elements for a StackRow (A part or interface row entry)
     Can contain multiple different stackup steps within this row
     """
-    COMBO_OPTIONS = ["Normal Distribution", "Uniform Distribution", "Skewed Distribution", "No Stack Contribution"]
+    COMBO_OPTIONS = ("Normal Distribution", "Uniform Distribution", "Skewed Distribution", "No Stack Contribution")
 
     # Text displayed for each label next to an entry. In order.
     NORMAL_TEXT = ["Mean", "Standard Deviation", "Lower Cutoff", "Upper Cutoff", None]
     UNIFORM_TEXT = ["Lower Limit", "Upper Limit", None, None, None]
     SKEW_TEXT = ["Mean", "Standard Deviation", "Skew", "Lower Cutoff", "Upper Cutoff"]
     NO_STACK_TEXT = [None, None, None, None, None]
+    # The text displayed for each combobox option
+    COMBO_TEXT = {"Normal Distribution": NORMAL_TEXT, "Uniform Distribution": UNIFORM_TEXT,
+                  "Skewed Distribution": SKEW_TEXT, "No Stack Contribution": NO_STACK_TEXT}
 
     def __init__(self, master=None, is_interface=False, mating_interface=None, init_entry=False, **kwargs):
         """
@@ -1023,26 +1209,16 @@ class StackRow(tk.Frame):
 
         inner_lr_list = []
         for it in enumerate(self.NORMAL_TEXT):
-            inner_lr_list.append(LabelRestrictedEntryFrame(self.right_inner_frame, it[1]))
+            inner_lr_list.append(LabelRestrictedEntryFrame(self.right_inner_frame, it[1], visible=it[1] is not None))
             inner_lr_list[it[0]].grid(row=row, column=it[0], padx=10)
-            if it[1] is None:
-                inner_lr_list[it[0]].hide()
 
         self.lr_list.append(inner_lr_list)
 
     def _combo_selection_change(self, event, row):
-        if self.dist_combo[row].get() == "Normal Distribution":
-            self.update_lref_display(self.NORMAL_TEXT, row)
-        elif self.dist_combo[row].get() == "Uniform Distribution":
-            self.update_lref_display(self.UNIFORM_TEXT, row)
-        elif self.dist_combo[row].get() == "Skewed Distribution":
-            self.update_lref_display(self.SKEW_TEXT, row)
-            return
-        elif self.dist_combo[row].get() == "No Stack Contribution":
-            self.update_lref_display(self.NO_STACK_TEXT, row)
-            return
-        else:
+        text = self.COMBO_TEXT.get(self.dist_combo[row].get())
+        if text is None:
             raise ValueError('Combobox has an unaccounted for value')
+        self.update_lref_display(text, row)
 
     def update_lref_display(self, text, row):
         """
@@ -1067,11 +1243,92 @@ class StackRow(tk.Frame):
         :param row: The row to update the LREFs for
         :return:
         """
-        self.description_entry[row].delete(0, "end")
-        self.description_entry[row].insert(0, description)
-        self.part_entry.delete(0, "end")
-        self.part_entry.insert(0, part_name)
+        # Entries that already hold their values are left as they are
+        if self.description_entry[row].get() != description:
+            self.description_entry[row].delete(0, "end")
+            self.description_entry[row].insert(0, description)
+        if self.part_entry.get() != part_name:
+            self.part_entry.delete(0, "end")
+            self.part_entry.insert(0, part_name)
         self.update_lref_display(text, row)
         for i in range(0, len(self.lr_list[row])):
             if values[i] is not None:
                 self.lr_list[row][i].set_value(values[i])
+
+
+class StepReport:
+    """
+    The histogram and summary table of a stackup step within the report frame. These are created once for each
+    stackup step shown and then updated on each refresh, rather than being recreated.
+    """
+
+    def __init__(self, master, row):
+        """
+        :param master: The frame the histogram and summary table are placed in
+        :param row: The row of the master frame the histogram and summary table are placed in
+        """
+        self.figure = plt.figure(figsize=(10, 5))
+        self.figure_canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.figure_canvas.get_tk_widget().grid(column=0, row=row, pady=30, ipady=50)
+
+        self.summary_table = Frame(master)
+        self.summary_table.grid_columnconfigure(0, weight=1)
+        self.summary_table.grid_columnconfigure(1, weight=1)
+        self.summary_table.grid_rowconfigure(0, weight=1)
+        self.summary_table.grid_rowconfigure(1, weight=1)
+        self.summary_table.grid_rowconfigure(2, weight=1)
+        self.summary_table.grid_rowconfigure(3, weight=1)
+
+        self.title_label = Label(self.summary_table, justify="center", anchor="center", font=("Arial bold", 12))
+        self.title_label.grid(row=0, column=0, columnspan=2, sticky=tk.W + tk.E, pady=15)
+
+        self.mean_label = Label(self.summary_table)
+        self.median_label = Label(self.summary_table)
+        self.mean_label.grid(row=1, column=0, pady=5, sticky="w")
+        self.median_label.grid(row=1, column=1, pady=5, sticky="w")
+
+        self.min_label = Label(self.summary_table)
+        self.max_label = Label(self.summary_table)
+        self.min_label.grid(row=2, column=0, pady=5, sticky="w")
+        self.max_label.grid(row=2, column=1, pady=5, sticky="w")
+
+        self.samples_label = Label(self.summary_table)
+        self.samples_label.grid(row=3, column=0, pady=5, sticky="w")
+
+        self.summary_table.grid(column=1, row=row, pady=10)
+
+    def update(self, stackup_step, radial_stack):
+        """
+        Redraws the histogram and updates the summary table for a stackup step
+        :param stackup_step: The stackup step to display
+        :param radial_stack: Whether the stack is a radial stack
+        :return: None
+        """
+        lengths = stackup_step.lengths
+
+        self.figure.clf()
+        self.figure.set_facecolor(_MPL_BACKGROUND)
+        hist_axes = StackManager.create_oal_diagram(None, self.figure.gca(), lengths, radial_stack=radial_stack)
+        hist_axes.set_title(f"Distribution Of Part: {stackup_step.part_name}, {stackup_step.description}")
+        # Creating the image also draws the histogram on the canvas
+        stackup_step.image = _get_axis_image(hist_axes)
+
+        if radial_stack:
+            # This is a radial stack, base off of magnitudes
+            lengths = lengths_to_magnitudes(lengths)
+
+        mean, median, minimum, maximum = _summarize(lengths)
+        self.title_label.config(text=f"Summary For Part: {stackup_step.part_name}, {stackup_step.description} ")
+        self.mean_label.config(text=f"Mean: {mean:.{_DECIMAL_PLACES}f}")
+        self.median_label.config(text=f"Median: {median:.{_DECIMAL_PLACES}f}")
+        self.min_label.config(text=f"Min: {minimum:.{_DECIMAL_PLACES}f}")
+        self.max_label.config(text=f"Max: {maximum:.{_DECIMAL_PLACES}f}")
+        self.samples_label.config(text=f"Number of Samples: {stackup_step.distribution.num_samples}")
+
+    def destroy(self):
+        """
+        Destroys the widgets of the histogram and summary table, and closes the histogram figure
+        :return: None
+        """
+        _close_figure(self.figure)
+        self.summary_table.destroy()
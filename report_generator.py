@@ -17,32 +17,75 @@ Network with him at: https://www.linkedin.com/in/samuellehmann/
 
 _DECIMAL_PLACES = 2
 
-# Styles for fonts
-# Normal text style
-_STYLE_N = getSampleStyleSheet()['Normal']
-_STYLE_N.fontName = "Helvetica"
-_STYLE_N.alignment = 1  # Center the text
+# Styles for fonts, cloned from a single sample stylesheet so that none of them share or modify another's settings
+_STYLE_SHEET = getSampleStyleSheet()
+
+# Normal text style, with the text centered
+_STYLE_N = _STYLE_SHEET['Normal'].clone("TolNinjaNormal", fontName="Helvetica", alignment=1)
+
+# Footer style
+_STYLE_FOOTER = _STYLE_N.clone("TolNinjaFooter", textColor=colors.darkgrey)
+
+# Footer text, added to every page
+_FOOTER_TEXT = ('Report created using Tol Ninja: <link href="https://github.com/slehmann1/Tol-Ninja">'
+                '<u>An open source tolerance stackup software</u></link><br />'
+                '<link href="https://www.linkedin.com/in/SamuelLehmann/"><u>Network with the developer</u></link><br />'
+                '<link href="https://www.buymeacoffee.com/SamuelLehmann"><u>Or maybe even tip them a coffee</u></link>')
 
 # Main header style
-_STYLE_H = getSampleStyleSheet()['Heading1']
-_STYLE_H.fontName = "Helvetica"
+_STYLE_H = _STYLE_SHEET['Heading1'].clone("TolNinjaHeading1", fontName="Helvetica")
 
 # Subheading style
-_STYLE_H2 = getSampleStyleSheet()['Heading1']
-_STYLE_H2.fontName = "Helvetica-bold"
-_STYLE_H2.fontSize = 12
+_STYLE_H2 = _STYLE_SHEET['Heading1'].clone("TolNinjaHeading2", fontName="Helvetica-bold", fontSize=12)
 
-# Table Header style
-_STYLE_TABLE_H = getSampleStyleSheet()["Normal"]
-_STYLE_TABLE_H.alignment = 1  # Center the text
-_STYLE_TABLE_H.textColor = colors.white
-_STYLE_TABLE_H.fontName = "Helvetica-bold"
+# Table Header style, with the text centered
+_STYLE_TABLE_H = _STYLE_SHEET['Normal'].clone("TolNinjaTableHeader", alignment=1, textColor=colors.white,
+                                              fontName="Helvetica-bold")
 
 _HORIZONTAL_MARGIN = 25.4 * mm
 _VERTICAL_MARGIN = 25.4 * mm
 WIDTH = 215.9 * mm - 2 * _HORIZONTAL_MARGIN
 HEIGHT = 279.4 * mm - 2 * _VERTICAL_MARGIN
 
+# Column widths of the tables, as tuples so that every table can share them
+_PARAM_COL_WIDTHS = (55.03333 * mm,) * 3
+_RESULTS_COL_WIDTHS = (50 * mm, 32.55 * mm, 50 * mm, 32.55 * mm)
+_STACKUP_COL_WIDTHS = (27.7 * mm, 27.7 * mm, 27.7 * mm, 15 * mm, 22 * mm, 15 * mm, 15 * mm, 15 * mm)
+
+# Table styles
+# The overall parameters table
+_PARAM_TABLE_STYLE = TableStyle([('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
+                                 ('BOX', (0, 0), (-1, -1), 1, colors.black),
+                                 ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
+                                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                                 ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+                                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.white)
+                                 ])
+
+# The overall results table and the table of each stackup step, where the header spans every column
+_RESULTS_TABLE_STYLE = TableStyle([
+    ('SPAN', (0, 0), (3, 0)),
+    ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+])
+
+# The stackup inputs table
+_STACKUP_TABLE_STYLE = TableStyle([
+    ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('FONT', (0, 0), (-1, -1), 'Helvetica', 11),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+])
+
 
 class ReportGenerator(object):
 
@@ -52,6 +95,10 @@ class ReportGenerator(object):
         self.author = author
         self.revision = revision
 
+        # The footer is the same on every page, so it is only parsed and wrapped once
+        self._footer = Paragraph(_FOOTER_TEXT, _STYLE_FOOTER)
+        self._footer.wrap(WIDTH, HEIGHT)
+
     def create_report(self, file_path: str, summary_image_list):
         """
         Generate a report which can be saved as a pdf
@@ -73,45 +120,20 @@ class ReportGenerator(object):
         story = [NextPageTemplate(['*', 'LaterPages']), Paragraph("Overall Parameters", _STYLE_H2)]
 
         # The parameters table
-        param_table = Table(self._generate_oal_params(), colWidths=[55.03333 * mm] * 3)
-        param_table.setStyle(TableStyle([('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
-                                         ('BOX', (0, 0), (-1, -1), 1, colors.black),
-                                         ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
-                                         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                                         ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-                                         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                                         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white)
-                                         ]))
+        param_table = Table(self._generate_oal_params(), colWidths=_PARAM_COL_WIDTHS)
+        param_table.setStyle(_PARAM_TABLE_STYLE)
         story.append(param_table)
         story.append(Spacer(10, 10))
 
         # The results table
-        results_table = Table(self._generate_results_params(), colWidths=(50 * mm, 32.55 * mm, 50 * mm, 32.55 * mm))
-        results_table.setStyle(TableStyle([
-            ('SPAN', (0, 0), (3, 0)),
-            ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
-            ('BOX', (0, 0), (-1, -1), 1, colors.black),
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ]))
+        results_table = Table(self._generate_results_params(), colWidths=_RESULTS_COL_WIDTHS)
+        results_table.setStyle(_RESULTS_TABLE_STYLE)
         story.append(results_table)
         story.append(Spacer(10, 10))
 
         # The stackup inputs table
-        stackup_table = Table(self._generate_stackup_inputs_params(),
-                              colWidths=(27.7 * mm, 27.7 * mm, 27.7 * mm, 15 * mm, 22 * mm, 15 * mm, 15 * mm, 15 * mm))
-        stackup_table.setStyle(TableStyle([
-            ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
-            ('BOX', (0, 0), (-1, -1), 1, colors.black),
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 11),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ]))
+        stackup_table = Table(self._generate_stackup_inputs_params(), colWidths=_STACKUP_COL_WIDTHS)
+        stackup_table.setStyle(_STACKUP_TABLE_STYLE)
         story.append(stackup_table)
         story.append(Spacer(10, 10))
 
@@ -121,18 +143,12 @@ class ReportGenerator(object):
         story.append(Paragraph("Overall Figures", _STYLE_H2))
         if self.stack_manager.further_image_paths:
             for image_path in self.stack_manager.further_image_paths:
-                image = Image(image_path)
-
-                height = image.drawHeight / (image.drawWidth / WIDTH)
-                image_flowable = Image(image_path, width=WIDTH, height=height)
-                story.append(image_flowable)
+                story.append(_full_width_image(image_path))
                 story.append(Spacer(10, 10))
 
         # Add summary images
         for image in summary_image_list:
-            height = Image(image).drawHeight / (Image(image).drawWidth / WIDTH)
-            image_flowable = Image(image, width=WIDTH, height=height)
-            story.append(image_flowable)
+            story.append(_full_width_image(image))
             story.append(Spacer(10, 10))
 
         story.append(PageBreak())
@@ -140,24 +156,12 @@ class ReportGenerator(object):
 
         # Add images and tables for each stackup step
         for stackup_step in self.stack_manager.stackup_steps:
-            stackup_table = Table(self._generate_stackup_step_params(stackup_step),
-                                  colWidths=(50 * mm, 32.55 * mm, 50 * mm, 32.55 * mm))
-            stackup_table.setStyle(TableStyle([
-                ('SPAN', (0, 0), (3, 0)),
-                ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
-                ('BOX', (0, 0), (-1, -1), 1, colors.black),
-                ('FONT', (0, 0), (-1, -1), 'Helvetica', 12),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ]))
+            stackup_table = Table(self._generate_stackup_step_params(stackup_step), colWidths=_RESULTS_COL_WIDTHS)
+            stackup_table.setStyle(_RESULTS_TABLE_STYLE)
             story.append(stackup_table)
             story.append(Spacer(10, 10))
 
-            height = Image(stackup_step.image).drawHeight / (Image(stackup_step.image).drawWidth / WIDTH)
-            image_flowable = Image(stackup_step.image, width=WIDTH, height=height)
-            story.append(image_flowable)
+            story.append(_full_width_image(stackup_step.image))
 
             story.append(Spacer(10, 10))
 
@@ -195,27 +199,8 @@ class ReportGenerator(object):
         """
 
         canvas.saveState()
-        footer_style = _STYLE_N
-        footer_style.alignment = 1
-        footer_style.textColor = colors.darkgrey
-
-        footer = Paragraph(
-            f'Report created using Tol Ninja: <link href="' + 'https://github.com/slehmann1/Tol-Ninja' + '">' +
-            "<u>An open source tolerance stackup software</u>" + '</link><br />' 
-
-            f'<link href="' + 'https://www.linkedin.com/in/SamuelLehmann/' + '">' +
-            "<u>Network with the developer</u>" + '</link><br />' +
-
-            f'<link href="' + 'https://www.buymeacoffee.com/SamuelLehmann' + '">' +
-            "<u>Or maybe even tip them a coffee</u>" + '</link>',
-
-            footer_style)
-
-        footer.wrap(WIDTH, HEIGHT)
-        footer.drawOn(canvas, _HORIZONTAL_MARGIN, _VERTICAL_MARGIN / 3)
-
+        self._footer.drawOn(canvas, _HORIZONTAL_MARGIN, _VERTICAL_MARGIN / 3)
         canvas.restoreState()
-        _STYLE_N.textColor = colors.black
 
     def _generate_oal_params(self):
         """
@@ -255,13 +240,14 @@ class ReportGenerator(object):
 
             table_params.append(
                 ["Mean:", _strval(stackup_step.lengths.mean()), "Median:", _strval(np.median(stackup_step.lengths))])
-            table_params.append(["Min:", _strval(min(stackup_step.lengths)), "Max:", _strval(max(stackup_step.lengths))])
+            table_params.append(["Min:", _strval(stackup_step.lengths.min()),
+                                 "Max:", _strval(stackup_step.lengths.max())])
         else:
             magnitudes = stack_manager.lengths_to_magnitudes(stackup_step.lengths)
 
             table_params.append(
                 ["Mean:", _strval(magnitudes.mean()), "Median:", _strval(np.median(magnitudes))])
-            table_params.append(["Min:", _strval(min(magnitudes)), "Max:", _strval(max(magnitudes))])
+            table_params.append(["Min:", _strval(magnitudes.min()), "Max:", _strval(magnitudes.max())])
 
         for table_param in table_params:
             stackup_step_params.append(_str_to_paragraph(table_param, _STYLE_N))
@@ -316,6 +302,19 @@ class ReportGenerator(object):
         return stackup_params
 
 
+def _full_width_image(image):
+    """
+    Creates an image flowable that spans the width of the page, keeping the aspect ratio of the image. The image is
+    only read once.
+    :param image: The path to the image, or a file-like object containing it
+    :return: The image flowable
+    """
+    image_flowable = Image(image)
+    image_flowable.drawHeight = image_flowable.drawHeight * WIDTH / image_flowable.drawWidth
+    image_flowable.drawWidth = WIDTH
+    return image_flowable
+
+
 def _line_to_paragraph(str_list, style):
     """
     Converts a 1D list of strings to an equivalent list of paragraph entries with the given style
@@ -349,7 +348,8 @@ def _str_to_paragraph(str_list, style):
 
 def _strval(value):
     """
-    Returns a string equivalent of the given float value rounded to the correct number of decimal places
+    Returns a string equivalent of the given value formatted to the correct number of decimal places. Integers,
+    such as the number of samples, are given without decimal places.
     :param value: The value to get a string for
     :return: A string representation of the value. If the value is none, it returns "-"
     """
@@ -357,13 +357,9 @@ def _strval(value):
         return "-"
     # This does not handle lists that aren't 1d
     if isinstance(value, list):
-        string = "("
-        for i in enumerate(value):
-            if i[1] is None:
-                return "-"
-            string += str(round(i[1], _DECIMAL_PLACES))
-            if i[0] < len(value):
-                string += ", "
-        string += ")"
-        return string
-    return str(round(value, _DECIMAL_PLACES))
+        if None in value:
+            return "-"
+        return "(" + ", ".join(_strval(item) for item in value) + ")"
+    if isinstance(value, (int, np.integer)):
+        return str(value)
+    return f"{value:.{_DECIMAL_PLACES}f}"
@@ -44,6 +44,30 @@ class StackManager:
         self.further_image_paths = None
         self.images = None
         self.lengths = None
+        # The lengths last summarized and a sorted copy of them, kept so that custom limits can be evaluated by a
+        # binary search rather than by another pass over every length
+        self._summarized_lengths = None
+        self._sorted_lengths = None
+        # The overall lengths are summed into this buffer, which is reused while the number of samples is unchanged
+        self._oal_buffer = None
+        # The absolute limits of the stackup, kept until a part is added
+        self._abs_limits = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The sorted lengths and the buffer of the overall lengths are recreated when they are next needed
+        state["_summarized_lengths"] = None
+        state["_sorted_lengths"] = None
+        state["_oal_buffer"] = None
+        return state
+
+    def __setstate__(self, state):
+        # Stack managers saved before the sorted lengths and the buffer were kept don't store them
+        self._summarized_lengths = None
+        self._sorted_lengths = None
+        self._oal_buffer = None
+        self._abs_limits = None
+        self.__dict__.update(state)
 
     def add_part(self, stackup_step: stackup_step.StackupStep):
         """
@@ -56,6 +80,10 @@ class StackManager:
 
         self.stackup_steps.append(stackup_step)
 
+        # The overall lengths and limits no longer include every part
+        self.lengths = None
+        self._abs_limits = None
+
     def calculate_stack(self, radial_stack=False):
         """
         Calculates all distributions within the stack
@@ -67,6 +95,9 @@ class StackManager:
             if stackup_step.lengths is None:
                 raise AttributeError(f"{stackup_step.name} failed to calculate length")
 
+        # The overall lengths were summed from the previous lengths of each step
+        self.lengths = None
+
     def create_arrow_diagram(self, axes):
         """
         Creates an arrow diagram
@@ -116,7 +147,7 @@ class StackManager:
                 lengths = self.calc_oal_dist()
 
         # Convert lengths to magnitudes
-        magnitudes = np.array([np.sqrt(lengths[0] ** 2 + lengths[1] ** 2)])[0]
+        magnitudes = lengths_to_magnitudes(lengths)
 
         if self:
             axes = stack_visualizer.histogram(axes, magnitudes, [0.0, self.oal_usl],
@@ -133,30 +164,44 @@ class StackManager:
 
     def calc_oal_dist(self):
         """
-        Computes the overall distribution, summing each step in the stackup
+        Computes the overall distribution, summing each step in the stackup. The lengths are only summed again once
+        a part is added or the stack is recalculated.
         :return: A numpy array of length values
         """
-        num_of_steps = len(self.stackup_steps)
+        if self.lengths is not None:
+            return self.lengths
 
-        if self.one_d_stack:
-            final_lengths = np.zeros(len(self.stackup_steps[0].lengths))
-            for i in range(num_of_steps):
-                final_lengths += self.stackup_steps[i].lengths
-        else:
-            final_lengths = [np.zeros(len(self.stackup_steps[0].lengths[0])),
-                             np.zeros(len(self.stackup_steps[0].lengths[1]))]
-            for i in range(num_of_steps):
-                final_lengths[0] += self.stackup_steps[i].lengths[0]
-                final_lengths[1] += self.stackup_steps[i].lengths[1]
+        radial_stack = not self.one_d_stack
+        first_lengths = self.stackup_steps[0].lengths
+        shape = (2, len(first_lengths[0])) if radial_stack else (len(first_lengths),)
+
+        if self._oal_buffer is None or self._oal_buffer.shape != shape:
+            self._oal_buffer = np.empty(shape)
+
+        # The buffer is refilled, so the lengths that were last summarized no longer match their sorted copy
+        self._summarized_lengths = None
+        self._sorted_lengths = None
 
-        self.lengths = final_lengths
-        return final_lengths
+        buffer_rows = self._oal_buffer if radial_stack else [self._oal_buffer]
+        for i, step in enumerate(self.stackup_steps):
+            step_rows = step.lengths if radial_stack else [step.lengths]
+            for buffer_row, step_row in zip(buffer_rows, step_rows):
+                if i == 0:
+                    np.copyto(buffer_row, step_row)
+                else:
+                    np.add(buffer_row, step_row, out=buffer_row)
+
+        self.lengths = list(self._oal_buffer) if radial_stack else self._oal_buffer
+        return self.lengths
 
     def get_abs_limits(self):
         """
         Calculate the absolute limits of the stackup. Returns None if limits cannot be calculated
         :return: None or a tuple of the [Absolute minimum limit, Absolute maximum limit]
         """
+        if self._abs_limits is not None:
+            return self._abs_limits
+
         abs_max = 0.0
         abs_min = 0.0
         all_abs_calculated = True
@@ -169,7 +214,8 @@ class StackManager:
                 abs_min += stackup_step.abs_min
 
         if all_abs_calculated:
-            return [abs_min, abs_max]
+            self._abs_limits = [abs_min, abs_max]
+            return self._abs_limits
         else:
             return None
 
@@ -179,10 +225,9 @@ class StackManager:
         :param further_image_paths: Strings of paths to the locations of the images
         :return: 
         """
-        if not self.further_image_paths or len(self.further_image_paths == 0):
-            self.further_image_paths = list(further_image_paths)
-        else:
-            self.further_image_paths.append(further_image_paths)
+        if not self.further_image_paths:
+            self.further_image_paths = []
+        self.further_image_paths.extend(further_image_paths)
 
     def get_summary_data(self, lengths, cust_limits=None):
         """
@@ -199,12 +244,25 @@ class StackManager:
             # Set LSL to 0
             specification_limits[0] = 0.0
 
+        if lengths is not self._summarized_lengths:
+            self._summarized_lengths = lengths
+            self._sorted_lengths = None
+
+        mean, std = _mean_and_std(lengths)
+        minimum = lengths.min()
+        maximum = lengths.max()
+
+        # Custom limits need the lengths sorted, in which case the median is read from them rather than partitioning
+        # the lengths a second time
+        if self._sorted_lengths is not None or (cust_limits and cust_limits[0] is not None
+                                                and cust_limits[1] is not None):
+            median = _sorted_median(self._get_sorted_lengths())
+        else:
+            median = np.median(lengths)
+
         if specification_limits and specification_limits[0] is not None and specification_limits[1] is not None:
             percent_below_lsl, percent_above_usl, percent_ok, percent_nok = \
-                self.determine_summary_percentages(lengths, specification_limits)
-
-        mean = lengths.mean()
-        std = np.std(lengths)
+                self.determine_summary_percentages(lengths, specification_limits, (minimum, maximum))
 
         if specification_limits and specification_limits[0] is not None and specification_limits[1] is not None:
             if not self.one_d_stack:
@@ -216,7 +274,7 @@ class StackManager:
 
         if cust_limits and cust_limits[0] is not None and cust_limits[1] is not None:
             percent_below_cust_lsl, percent_above_cust_usl, percent_cust_ok, percent_cust_nok = \
-                self.determine_summary_percentages(lengths, cust_limits)
+                percentages_from_sorted(self._get_sorted_lengths(), cust_limits)
 
         self.summary_data = self.Summary_Data(percent_below_lsl=percent_below_lsl,
                                               percent_above_usl=percent_above_usl,
@@ -225,36 +283,67 @@ class StackManager:
                                               percent_below_cust_lsl=percent_below_cust_lsl,
                                               percent_above_cust_usl=percent_above_cust_usl,
                                               percent_cust_ok=percent_cust_ok,
-                                              percent_cust_nok=percent_cust_nok, mean=mean, median=np.median(lengths),
-                                              min=min(lengths), max=max(lengths), target_limits=specification_limits,
+                                              percent_cust_nok=percent_cust_nok, mean=mean, median=median,
+                                              min=minimum, max=maximum,
+                                              target_limits=specification_limits,
                                               samples=len(lengths),
                                               std=std, cpk=cpk)
 
         return self.summary_data
 
-    def determine_summary_percentages(self, lengths, limits):
+    def update_custom_limits(self, cust_limits):
+        """
+        Updates the custom limit percentages of the summary data, without recalculating any other statistics. The
+        lengths that were last summarized by get_summary_data are reused.
+        :param cust_limits: The imposed limits for which percentages above/below should be calculated
+        :return: A Summary_Data named tuple
+        """
+        percentages = (None for _ in range(4))
+
+        if cust_limits and cust_limits[0] is not None and cust_limits[1] is not None:
+            percentages = percentages_from_sorted(self._get_sorted_lengths(), cust_limits)
+
+        percent_below_cust_lsl, percent_above_cust_usl, percent_cust_ok, percent_cust_nok = percentages
+        self.summary_data = self.summary_data._replace(percent_below_cust_lsl=percent_below_cust_lsl,
+                                                       percent_above_cust_usl=percent_above_cust_usl,
+                                                       percent_cust_ok=percent_cust_ok,
+                                                       percent_cust_nok=percent_cust_nok)
+        return self.summary_data
+
+    def determine_summary_percentages(self, lengths, limits, bounds=None):
         """
         Calculates percentages within and outside of limits for the get_summary data function
         :param lengths:
         :param limits:
-        :return:
+        :param bounds: The minimum and maximum of the lengths, if already known. Lengths aren't compared against
+        limits that lie outside of these. Optional
+        :return: The percentages below the lower limit, above the upper limit, within and outside of the limits
         """
 
-        if len(lengths) == 2 and self.stackup_steps[0].num_samples != 2:
+        if len(lengths) == 2 and self.stackup_steps[0].distribution.num_samples != 2:
             # This is a radial stack, base off of magnitudes
-            lengths = [np.sqrt(lengths[0] ** 2 + lengths[1] ** 2)][0]
-            percent_below_min = 0.0
+            lengths = lengths_to_magnitudes(lengths)
+            num_below_min = 0
+        elif bounds is not None and limits[0] <= bounds[0]:
+            num_below_min = 0
         else:
-            percent_below_min = [i for i in lengths if i < limits[0]]
-            percent_below_min = 100.0 * len(percent_below_min) / len(lengths)
+            num_below_min = np.count_nonzero(lengths < limits[0])
 
-        percent_above_max = [i for i in lengths if i > limits[1]]
-        percent_above_max = 100.0 * len(percent_above_max) / len(lengths)
+        if bounds is not None and limits[1] >= bounds[1]:
+            num_above_max = 0
+        else:
+            num_above_max = np.count_nonzero(lengths > limits[1])
 
-        percent_nok = percent_below_min + percent_above_max
-        percent_ok = 100 - percent_above_max - percent_below_min
+        return _summary_percentages(num_below_min, num_above_max, len(lengths))
 
-        return [percent_below_min, percent_above_max, percent_nok, percent_ok]
+    def _get_sorted_lengths(self):
+        """
+        Sorts the lengths that were last summarized, only if they have not already been sorted
+        :return: The sorted lengths
+        """
+        if self._sorted_lengths is None:
+            self._sorted_lengths = np.sort(self._summarized_lengths)
+        return self._sorted_lengths
 
 
 def get_cpk(lsl, usl, mean, std):
@@ -275,7 +364,23 @@ def lengths_to_magnitudes(lengths):
     :param lengths: Length values where lengths[0] is x and lengths[1] is y
     :return: The magnitudes of the length values
     """
-    return np.array([np.sqrt(lengths[0] ** 2 + lengths[1] ** 2)])[0]
+    # Accumulate in place, rather than allocating a new array for each operation and copying the result
+    magnitudes = np.square(lengths[0])
+    magnitudes += np.square(lengths[1])
+    return np.sqrt(magnitudes, out=magnitudes)
+
+
+def percentages_from_sorted(sorted_lengths, limits):
+    """
+    Calculates percentages within and outside of limits, using a binary search of lengths that are already sorted
+    :param sorted_lengths: Length values, sorted in ascending order
+    :param limits: The lower and upper limits
+    :return: The percentages below the lower limit, above the upper limit, within and outside of the limits
+    """
+    num_below_min = np.searchsorted(sorted_lengths, limits[0], side="left")
+    num_above_max = len(sorted_lengths) - np.searchsorted(sorted_lengths, limits[1], side="right")
+
+    return _summary_percentages(num_below_min, num_above_max, len(sorted_lengths))
 
 
 def range_for_percentage(percentage, type, lengths):
@@ -287,18 +392,70 @@ def range_for_percentage(percentage, type, lengths):
     :return:The range of values. Will be a tuple for a bi-lateral case
     """
 
+    # Only the value at the target position is needed, so the lengths are partitioned around it rather than sorted
     if type == "Left":
-        lengths = np.sort(lengths)
         target_count = math.ceil(percentage * len(lengths) / 100)
-        return lengths[target_count]
+        return _select(lengths, target_count)
 
     elif type == "Right":
-        lengths = np.sort(lengths)
         target_count = math.ceil(percentage * len(lengths) / 100)
-        return lengths[-target_count]
+        return _select(lengths, -target_count)
 
     elif type == "Bi-Lateral":
         lengths = abs(lengths)
-        lengths = np.sort(lengths)
         target_count = math.ceil(percentage * len(lengths) / 100)
-        return [-lengths[target_count], lengths[target_count]]
+        value = _select(lengths, target_count)
+        return [-value, value]
+
+
+def _summary_percentages(num_below_min, num_above_max, num_lengths):
+    """
+    Converts counts of lengths outside of limits into percentages
+    :param num_below_min: The number of lengths below the lower limit
+    :param num_above_max: The number of lengths above the upper limit
+    :param num_lengths: The total number of lengths
+    :return: The percentages below the lower limit, above the upper limit, within and outside of the limits
+    """
+    percent_below_min = 100.0 * num_below_min / num_lengths
+    percent_above_max = 100.0 * num_above_max / num_lengths
+
+    percent_nok = percent_below_min + percent_above_max
+    percent_ok = 100 - percent_above_max - percent_below_min
+
+    return [percent_below_min, percent_above_max, percent_ok, percent_nok]
+
+
+def _mean_and_std(lengths):
+    """
+    Calculates the mean and population standard deviation of lengths. The squared deviations are summed by a single
+    dot product, rather than squared into a further temporary array and then summed as np.std does.
+    :param lengths: The lengths, as a numpy array
+    :return: The mean and the standard deviation
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    mean = lengths.sum() / len(lengths)
+    deviations = lengths - mean
+    return mean, math.sqrt(np.dot(deviations, deviations) / len(lengths))
+
+
+def _sorted_median(sorted_lengths):
+    """
+    Gets the median of lengths that are already sorted
+    :param sorted_lengths: Length values, sorted in ascending order
+    :return: The median of the lengths
+    """
+    middle = len(sorted_lengths) // 2
+    if len(sorted_lengths) % 2:
+        return sorted_lengths[middle]
+    return (sorted_lengths[middle - 1] + sorted_lengths[middle]) / 2
+
+
+def _select(lengths, index):
+    """
+    Gets the value that would be at an index of the lengths if they were sorted, without sorting them
+    :param lengths: The lengths, as a numpy array
+    :param index: The index into the sorted lengths, which may be negative
+    :return: The value at the index
+    """
+    index = range(len(lengths))[index]
+    return np.partition(lengths, index)[index]
@@ -1,5 +1,8 @@
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.patches import FancyArrow
 import stack_manager
 
 """
@@ -10,6 +13,15 @@ Network with him at: https://www.linkedin.com/in/samuellehmann/
 HISTOGRAM_BINS = 50
 LIMIT_TEXT_SPACING = 0.1
 
+# Radial diagrams of more samples than this are drawn as a density of binned samples rather than as a scatter plot,
+# as drawing each sample as a separate marker becomes slow
+RADIAL_SCATTER_MAX_SAMPLES = 50000
+# The number of angular and radial bins of the radial density diagram
+RADIAL_THETA_BINS = 180
+RADIAL_MAGNITUDE_BINS = 100
+# Grey, fading from transparent where no samples are binned to opaque
+RADIAL_DENSITY_CMAP = LinearSegmentedColormap.from_list("radial_density", [(0.5, 0.5, 0.5, 0.0), (0.5, 0.5, 0.5, 1.0)])
+
 
 def arrow_diagram(axs, stackup_steps, min_target_length=None, max_target_length=None, display_absolute_range=True):
     """
@@ -32,34 +44,38 @@ def arrow_diagram(axs, stackup_steps, min_target_length=None, max_target_length=
 
     head_width = len(stackup_steps)/25
 
-    # draw arrows
-    last_step_x = 0
+    # Each arrow starts where the previous one ends
+    mid_lengths = np.array([stackup_step.mid_length for stackup_step in stackup_steps], dtype=np.float64)
+    start_xs = np.cumsum(mid_lengths) - mid_lengths
+
+    arrows = []
     labels = []
 
-    for stackup_step in enumerate(stackup_steps):
+    for i, stackup_step in enumerate(stackup_steps):
 
-        if stackup_step[1].mid_length > 0:
+        if mid_lengths[i] > 0:
             colour_string = "Green"
         else:
             colour_string = "Red"
 
-        if not stackup_step[1].abs_max or not stackup_step[1].abs_min:
+        if not stackup_step.abs_max or not stackup_step.abs_min:
             all_abs_calculated = False
         else:
-            abs_max += stackup_step[1].abs_max
-            abs_min += stackup_step[1].abs_min
-
-        axs.arrow(y=stackup_step[0], dy=0, x=last_step_x, dx=stackup_step[1].mid_length,
-                  width=head_width / 3,
-                  length_includes_head=True, head_width=head_width, color=colour_string)
+            abs_max += stackup_step.abs_max
+            abs_min += stackup_step.abs_min
 
-        last_step_x = last_step_x + stackup_step[1].mid_length
+        arrows.append(FancyArrow(x=start_xs[i], y=i, dx=mid_lengths[i], dy=0, width=head_width / 3,
+                                 length_includes_head=True, head_width=head_width, color=colour_string))
 
-        label = stackup_step[1].part_name
-        if stackup_step[1].description:
-            label += ", " + stackup_step[1].description
+        label = stackup_step.part_name
+        if stackup_step.description:
+            label += ", " + stackup_step.description
         labels.append(label)
 
+    # The arrows are drawn as a single collection, rather than as a separate patch each
+    axs.add_collection(PatchCollection(arrows, match_original=True))
+    axs.autoscale_view()
+
     if display_absolute_range and all_abs_calculated:
         axs.axvspan(abs_min, abs_max, color='grey', zorder=-1, label='Specification Limits', alpha=0.3)
 
@@ -87,13 +103,17 @@ def histogram(axs, lengths, length_bounds=None, abs_bounds=None, title_prefix="H
     :return:
     """
 
-    # Convert the axis from polar coordinates
-    fig = axs.get_figure()
-    axs.remove()
-    axs = fig.add_subplot(1, 1, 1)
-
-    axs.cla()
-    axs.hist(lengths, histtype='step', bins=HISTOGRAM_BINS, zorder=3, color='white')
+    if axs.name == "polar":
+        # Convert the axis from polar coordinates, keeping its place in the figure
+        fig = axs.get_figure()
+        subplot_spec = axs.get_subplotspec()
+        axs.remove()
+        axs = fig.add_subplot(subplot_spec)
+    else:
+        axs.cla()
+
+    counts, edges = np.histogram(lengths, bins=HISTOGRAM_BINS, range=(lengths.min(), lengths.max()))
+    axs.stairs(counts, edges, zorder=3, color='white')
     axs.set_title(f'{title_prefix}, {len(lengths)} Samples')
 
     if abs_bounds is not None and abs_bounds[0] is not None and abs_bounds[1] is not None:
@@ -107,12 +127,14 @@ def histogram(axs, lengths, length_bounds=None, abs_bounds=None, title_prefix="H
 
     x0, x1 = axs.get_xlim()
     y0, y1 = axs.get_ylim()
+    # Fix the x limits, so that the "fail range" doesn't reset them
+    axs.set_xlim([x0, x1])
 
     if length_bounds is not None and length_bounds[1] is not None:
-        out_range = [i for i in lengths if i > length_bounds[1]]
+        num_out_range = np.count_nonzero(lengths > length_bounds[1])
 
-        if len(out_range) > 0:
-            out_range_percent = 100.0 * len(out_range) / len(lengths)
+        if num_out_range > 0:
+            out_range_percent = 100.0 * num_out_range / len(lengths)
             axs.axvspan(length_bounds[1], x1, color='red', zorder=1, alpha=0.1, label="Outside Specification Limits")
             axs.axvline(length_bounds[1], color='red', zorder=2, linestyle='--')
             axs.text(x=length_bounds[1] + LIMIT_TEXT_SPACING, y=((y1 - y0) * 0.85),
@@ -120,19 +142,15 @@ def histogram(axs, lengths, length_bounds=None, abs_bounds=None, title_prefix="H
                      color='red', horizontalalignment='left')
 
     if length_bounds is not None and length_bounds[0] is not None:
-        out_range = [i for i in lengths if i < length_bounds[0]]
-        if len(out_range) > 0:
-            out_range_percent = 100.0 * len(out_range) / len(lengths)
+        num_out_range = np.count_nonzero(lengths < length_bounds[0])
+        if num_out_range > 0:
+            out_range_percent = 100.0 * num_out_range / len(lengths)
             axs.axvspan(x0, length_bounds[0], color='red', zorder=1, alpha=0.1)
             axs.axvline(length_bounds[0], color='red', zorder=2, linestyle='--')
             axs.text(x=length_bounds[0] - LIMIT_TEXT_SPACING, y=((y1 - y0) * 0.85),
                      s=f'{out_range_percent:.001f}% Below\nMinimum',
                      color='red', horizontalalignment='right')
 
-    # Set the x limits back to what they were before the "fail range" reset them
-    axs.set_xlim([x0, x1])
-    axs.set_xlim([x0, x1])
-
     axs.set_xlabel("Dimension")
     axs.set_ylabel("Frequency")
 
@@ -159,16 +177,30 @@ def radial_diagram(axs, lengths, length_bounds=None):
     alpha = alpha if alpha > 0.1 else 0.1
 
     magnitudes = stack_manager.lengths_to_magnitudes(lengths)
-    np.random.shuffle(magnitudes)
-    thetas = [np.arctan(lengths[1], lengths[0])]
-
-    thetas = [theta * 360.0 / 2.0 / np.pi for theta in thetas]
-
-    # Convert the axis to polar coordinates
-    fig = axs.get_figure()
-    axs.remove()
-    axs = fig.add_subplot(1, 1, 1, projection="polar")
-    axs.scatter(thetas, magnitudes, label='Samples', color="grey", alpha=alpha)
+    # Polar axes take angles in radians
+    thetas = np.arctan2(lengths[1], lengths[0])
+
+    if axs.name != "polar":
+        # Convert the axis to polar coordinates, keeping its place in the figure
+        fig = axs.get_figure()
+        subplot_spec = axs.get_subplotspec()
+        axs.remove()
+        axs = fig.add_subplot(subplot_spec, projection="polar")
+    else:
+        axs.cla()
+
+    if len(magnitudes) > RADIAL_SCATTER_MAX_SAMPLES:
+        counts, theta_edges, magnitude_edges = np.histogram2d(
+            thetas, magnitudes, bins=(RADIAL_THETA_BINS, RADIAL_MAGNITUDE_BINS),
+            range=((-np.pi, np.pi), (0.0, magnitudes.max())))
+        # Shade each bin as if its samples were overlapping markers of the scatter plot
+        opacities = 1.0 - (1.0 - alpha) ** counts.T
+        axs.pcolormesh(theta_edges, magnitude_edges, opacities, cmap=RADIAL_DENSITY_CMAP, vmin=0.0, vmax=1.0,
+                       shading='flat')
+        # The density mesh can't be shown in a legend, so an empty scatter plot is used in its place
+        axs.scatter([], [], label='Samples', color="grey", alpha=alpha)
+    else:
+        axs.scatter(thetas, magnitudes, label='Samples', color="grey", alpha=alpha)
 
     x0, x1 = axs.get_xlim()
     y0, y1 = axs.get_ylim()
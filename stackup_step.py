@@ -63,16 +63,26 @@ class StackupStep:
 
         if not self.one_d_stack:
             # Ensure that no negative values are generated
-            if self.distribution.lower_lim:
-                self.distribution.lower_lim = max(0.0, self.distribution.lower_lim)
+            if self.distribution.lower_lim is not None:
+                self.distribution.set_limits(max(0.0, self.distribution.lower_lim), self.distribution.upper_lim)
             else:
-                self.distribution.lower_lim = 0.0
+                self.distribution.set_limits(0.0, self.distribution.upper_lim)
 
             magnitudes = self.distribution.calculate()
-            # in rad
-            angles = np.random.random(self.distribution.num_samples) * 2 * np.pi
 
-            self.lengths = [magnitudes * np.cos(angles), magnitudes * np.sin(angles)]
+            # The x and y lengths are the rows of a single array of the type of the samples, which is reused while
+            # the number of samples and their type are unchanged. The angles are drawn into the y row from the
+            # generator of the distribution, so that no further array is allocated.
+            shape = (2, self.distribution.num_samples)
+            dtype = self.distribution.dtype
+            if not isinstance(self.lengths, np.ndarray) or self.lengths.shape != shape or self.lengths.dtype != dtype:
+                self.lengths = np.empty(shape, dtype=dtype)
+            # in rad
+            angles = self.distribution.rng().random(dtype=dtype, out=self.lengths[1])
+            angles *= 2 * np.pi
+            np.cos(angles, out=self.lengths[0])
+            np.sin(angles, out=self.lengths[1])
+            self.lengths *= magnitudes
 
         else:
             self.lengths = self.distribution.calculate()